@@ -6,7 +6,7 @@ import httpx
 import logging
 from dotenv import load_dotenv
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional
 
 from . import server
 from . import models
@@ -65,6 +65,48 @@ class AgentAPI:
             user_location=os.getenv("USER_LOCATION", "Unknown")
         )
 
+    def _build_messages(
+        self,
+        prompt: str,
+        context: str = "",
+        environment_details: Optional[str] = None
+    ) -> List[Dict[str, str]]:
+        """Assemble system prompt, session history and the user turn."""
+        messages = []
+
+        # Inject system prompt as first message
+        if self.system_prompt:
+            messages.append({"role": "system", "content": self.system_prompt})
+
+        # Add conversation history
+        if self.session and self.session.history:
+            messages.extend(self.session.history)
+
+        # Build user message with context and environment details
+        user_content = ""
+        if context:
+            user_content += f"{context}\n\n"
+        user_content += prompt
+        if environment_details:
+            user_content += f"\n\n{environment_details}"
+
+        messages.append({"role": "user", "content": user_content})
+        return messages
+
+    def _request_headers(self) -> Dict[str, str]:
+        """Build HTTP headers for the chat completions endpoint."""
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+
+        # Add OpenRouter-specific headers if using OpenRouter
+        if "openrouter.ai" in self.base_url:
+            headers.update({
+                "X-Requested-With": "XMLHttpRequest"
+            })
+        return headers
+
     async def generate_response(
         self,
         prompt: str,
@@ -90,25 +132,7 @@ class AgentAPI:
             "conversation_length": len(self.session.history) if self.session else 0
         })
 
-        messages = []
-
-        # Inject system prompt as first message
-        if self.system_prompt:
-            messages.append({"role": "system", "content": self.system_prompt})
-
-        # Add conversation history
-        if self.session and self.session.history:
-            messages.extend(self.session.history)
-
-        # Build user message with context and environment details
-        user_content = ""
-        if context:
-            user_content += f"{context}\n\n"
-        user_content += prompt
-        if environment_details:
-            user_content += f"\n\n{environment_details}"
-
-        messages.append({"role": "user", "content": user_content})
+        messages = self._build_messages(prompt, context, environment_details)
 
         payload = {
             "model": self.model,
@@ -120,17 +144,7 @@ class AgentAPI:
         # Ensure proper JSON serialization by pre-encoding
         # This prevents issues with special characters in the system prompt
         payload_json = json.dumps(payload, ensure_ascii=False)
-
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-
-        # Add OpenRouter-specific headers if using OpenRouter
-        if "openrouter.ai" in self.base_url:
-            headers.update({
-                "X-Requested-With": "XMLHttpRequest"
-            })
+        headers = self._request_headers()
 
         async with httpx.AsyncClient() as client:
             try:
@@ -192,4 +206,95 @@ class AgentAPI:
                 })
                 raise Exception(f"Network error: {str(e)}")
 
+    async def stream_response(
+        self,
+        prompt: str,
+        context: str = "",
+        environment_details: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response from the AI model as content deltas arrive.
+
+        Takes the same arguments as ``generate_response``. The full reply is
+        appended to the session history once the stream completes.
+
+        Yields:
+            Content fragments in the order the model produced them.
+        """
+        logger.info("Starting streaming response generation", extra={
+            "model": self.model,
+            "prompt_length": len(prompt),
+            "context_length": len(context),
+        })
+
+        payload = {
+            "model": self.model,
+            "messages": self._build_messages(prompt, context, environment_details),
+            "temperature": 0.7,
+            "max_tokens": 8000,
+            "stream": True
+        }
+        payload_json = json.dumps(payload, ensure_ascii=False)
+        headers = self._request_headers()
+        parts: List[str] = []
+
+        async with httpx.AsyncClient() as client:
+            try:
+                async with client.stream(
+                    "POST",
+                    f"{self.base_url}/chat/completions",
+                    content=payload_json,
+                    headers=headers,
+                    timeout=120.0
+                ) as response:
+                    if response.status_code != 200:
+                        error_text = (await response.aread()).decode("utf-8", errors="replace")
+                        logger.error("API request failed", extra={
+                            "status_code": response.status_code,
+                            "response_text": error_text[:500],
+                            "model": self.model
+                        })
+                        raise Exception(f"API request failed: {response.status_code} - {error_text}")
+
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        data = line[5:].strip()
+                        if data == "[DONE]":
+                            break
+                        try:
+                            event = json.loads(data)
+                        except ValueError:
+                            continue
+                        choices = event.get("choices") or []
+                        if not choices:
+                            continue
+                        token = (choices[0].get("delta") or {}).get("content")
+                        if token:
+                            parts.append(token)
+                            yield token
+
+            except httpx.TimeoutException:
+                logger.error("API request timeout", extra={
+                    "model": self.model,
+                    "timeout_seconds": 120.0
+                })
+                raise Exception("API request timed out")
+            except httpx.NetworkError as e:
+                logger.error("Network error during API request", extra={
+                    "model": self.model,
+                    "error_type": type(e).__name__,
+                    "error_message": str(e)
+                })
+                raise Exception(f"Network error: {str(e)}")
+
+        response_text = "".join(parts)
+        logger.info("Streaming response completed", extra={
+            "model": self.model,
+            "response_length": len(response_text),
+            "status": "success"
+        })
+        if self.session:
+            self.session.history.append({"role": "assistant", "content": response_text})
+
 __all__ = ["server", "models", "app", "AgentAPI"]
@@ -1,5 +1,6 @@
 """API endpoint definitions."""
 
+import time
 from datetime import datetime
 from typing import List
 from fastapi import APIRouter, HTTPException
@@ -41,7 +42,7 @@ async def health() -> dict[str, object]:
 @router.get("/v1/models")
 async def list_models() -> ModelList:
     """List available models (OpenAI compatible)."""
-    timestamp = int(datetime.now().timestamp())
+    timestamp = int(time.time())
     return ModelList(
         object="list",
         data=[
@@ -56,7 +57,7 @@ async def get_model(model_id: str) -> Model:
     """Get specific model information."""
     if model_id not in {"mcp-agent", "mcp-agent-tools"}:
         raise HTTPException(status_code=404, detail="Model not found")
-    return Model(id=model_id, created=int(datetime.now().timestamp()), owned_by="mcp-agent")
+    return Model(id=model_id, created=int(time.time()), owned_by="mcp-agent")
 
 
 @router.post("/v1/chat/completions")
@@ -64,7 +65,7 @@ async def chat_completions(request: ChatCompletionRequest):
     """OpenAI-compatible chat completions endpoint (streaming and batch)."""
     agent = get_agent()
     executor = get_plugin_executor()
-    request_id = f"chatcmpl-{datetime.now().timestamp()}"
+    request_id = f"chatcmpl-{time.time()}"
 
     system_message = """You are an AI agent with direct tool execution and visual content generation capabilities.
 
@@ -110,7 +111,7 @@ Be direct and actionable. When tools execute, acknowledge the results briefly.""
 
     response = ChatCompletionResponse(
         id=request_id,
-        created=int(datetime.now().timestamp()),
+        created=int(time.time()),
         model=request.model,
         choices=[
             ChatCompletionChoice(
@@ -1,13 +1,32 @@
 """FastAPI server configuration and application setup."""
 
 import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+try:
+    from src.plugins.browser import schedule_warmup
+except ImportError:  # pragma: no cover - playwright not installed
+    schedule_warmup = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Start the browser in the background when BROWSER_WARMUP is set."""
+    warmup_task = schedule_warmup() if schedule_warmup else None
+    yield
+    if warmup_task and not warmup_task.done():
+        warmup_task.cancel()
+
+
 app = FastAPI(
     title="MCP AI Agent API",
     description="OpenAI-compatible API for MCP AI Agent with tool execution",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -609,6 +609,17 @@ class ArtifactGenerator:
         
         return articles
     
+    @staticmethod
+    def needs_formatting(text: str) -> bool:
+        """Return True if ``format_text_response`` would change ``text``."""
+        return (
+            '\n\n' in text
+            or '- ' in text
+            or '* ' in text
+            or text[:1].isspace()
+            or text[-1:].isspace()
+        )
+
     @staticmethod
     def format_text_response(text: str) -> str:
         """Format plain text responses with better structure."""
@@ -1,9 +1,9 @@
 import typer
-import asyncio
 from typing import Dict, Any, Optional
 import json
 from .core import Agent
 from .mcp_loader import MCPLoader
+from .utils import event_loop
 
 cli_app = typer.Typer(help="Modular CLI AI Agent with MCP Integration")
 
@@ -22,7 +22,7 @@ def run():
         except KeyboardInterrupt:
             await agent.save_and_exit()
 
-    asyncio.run(_run())
+    event_loop.run(_run())
 
 @cli_app.command()
 def add_tool(
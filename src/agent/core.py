@@ -9,7 +9,6 @@ delegating specialised behavior to services under ``src/agent/services``.
 
 from __future__ import annotations
 
-import asyncio
 from typing import AsyncGenerator, Dict, Any, List
 
 import sys
@@ -24,6 +23,8 @@ from .memory import MemoryStoreFileImpl
 from .mcp_loader import MCPLoader
 from .models import MCPTool
 from .plugin_executor import PluginExecutor
+from .utils import event_loop
+from .services.coalescing import CoalescingExecutor
 from .services.context import build_memory_context, build_tool_context
 from .services.instructions import load_custom_instructions
 from .services.react_runner import ReactLoopRunner
@@ -44,7 +45,7 @@ class Agent:
         self.memory = MemoryStoreFileImpl(memory_path)
         self.session_manager = SessionManager(self.memory)
         self.plugin_executor = PluginExecutor()
-        self.tool_dispatcher = ToolDispatcher(self.plugin_executor)
+        self.tool_dispatcher = ToolDispatcher(CoalescingExecutor(self.plugin_executor))
 
         self.session_id = self.session_manager.new_session_id()
         self.session = self.session_manager.load(self.session_id)
@@ -93,7 +94,7 @@ class Agent:
                     ascii_message = message.encode("ascii", errors="ignore").decode("ascii")
                     print(ascii_message)
 
-        asyncio.run(_run())
+        event_loop.run(_run())
 
     def _build_tool_context(self) -> str:
         """Build context about available tools for AI."""
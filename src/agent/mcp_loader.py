@@ -1,18 +1,33 @@
 import json
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from .models import MCPTool
 
+# config path -> (mtime_ns, size, tools) for the last successful parse
+_TOOLS_CACHE: Dict[Path, Tuple[int, int, List[MCPTool]]] = {}
+
 class MCPLoader:
     def __init__(self, config_path: str = "config/mcp_tools.json"):
         self.config_path = Path(config_path)
         self.tools: List[MCPTool] = []
 
     def load_tools(self) -> List[MCPTool]:
-        """Load and validate tools from config JSON."""
-        if not self.config_path.exists():
+        """Load and validate tools from config JSON.
+
+        Parsed tools are memoized by the file's modification time and size,
+        so repeat loads of an unchanged config cost a single ``stat``.
+        """
+        try:
+            stat = self.config_path.stat()
+        except OSError:
             self.tools = []
             return self.tools
+
+        cached = _TOOLS_CACHE.get(self.config_path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            self.tools = list(cached[2])
+            return self.tools
+
         try:
             with open(self.config_path, 'r') as f:
                 config = json.load(f)
@@ -39,6 +54,8 @@ class MCPLoader:
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             print(f"Config validation error: {e}")
             self.tools = []
+        else:
+            _TOOLS_CACHE[self.config_path] = (stat.st_mtime_ns, stat.st_size, list(self.tools))
         return self.tools
 
     def list_available_tools(self) -> List[str]:
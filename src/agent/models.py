@@ -117,6 +117,7 @@ class Session:
         history: List of conversation messages
         current_task: Currently active task description
         loaded_tools: Tools available in this session
+        tools_by_name: Name index over ``loaded_tools`` (first registration wins)
         created_at: Session creation timestamp
     """
     
@@ -140,6 +141,17 @@ class Session:
         self.created_at = created_at or datetime.now()
         self.updated_at = updated_at or datetime.now()
 
+    @property
+    def loaded_tools(self) -> List[MCPTool]:
+        """Tools available in this session."""
+        return self._loaded_tools
+
+    @loaded_tools.setter
+    def loaded_tools(self, tools: List[MCPTool]) -> None:
+        self._loaded_tools = tools
+        # Reversed so the first tool registered under a name wins.
+        self.tools_by_name: Dict[str, MCPTool] = {tool.name: tool for tool in reversed(tools)}
+
     def model_dump(self) -> Dict[str, Any]:
         """Serialize session to dictionary format.
 
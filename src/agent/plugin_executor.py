@@ -74,7 +74,7 @@ class PluginExecutor:
         # Analysis plugin (JS REPL)
         try:
             from src.plugins.analysis import ReplPlugin
-            self.plugins['analysis'] = ReplPlugin
+            self.plugins['analysis'] = ReplPlugin()
         except ImportError:
             pass
 
@@ -97,6 +97,8 @@ class PluginExecutor:
                 return await self._execute_enhanced_news_tool(tool_name, args)
             if server == 'leann':
                 return await self._execute_leann_tool(tool_name, args)
+            if server == 'analysis':
+                return await self._execute_analysis_tool(tool_name, args)
             reason = f"Server '{server}' not implemented"
             self._fail(server, tool_name, reason)
 
@@ -179,7 +181,7 @@ class PluginExecutor:
             return {"result": result, "status": "success"}
         elif tool_name == 'screenshot':
             path = args.get('path')
-            result = await browser.screenshot(path)
+            result = await browser.screenshot(path, encoding='base64')
             return {"result": result, "status": "success"}
         elif tool_name == 'click':
             selector = args.get('selector')
@@ -204,7 +206,11 @@ class PluginExecutor:
             result = await browser.get_links()
             return {"result": result, "status": "success"}
         elif tool_name == 'extract-content-smart':
-            result = await browser.extract_content_smart()
+            url = args.get('url')
+            if url:
+                result = await browser.extract_url(url, wait_selector=args.get('wait_selector'))
+            else:
+                result = await browser.extract_content_smart()
             return {"result": result, "status": "success"}
         elif tool_name == 'get-news-smart':
             topic = args.get('topic', 'ai')
@@ -303,3 +309,12 @@ class PluginExecutor:
         # Call the plugin's execute method directly
         result = await leann_plugin.execute('leann', tool_name, args)
         return cast(Dict[str, Any], result)
+
+    async def _execute_analysis_tool(self, tool_name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute analysis (JS REPL) tools."""
+        analysis_plugin = self.plugins.get('analysis')
+        if not analysis_plugin:
+            return {"error": "Analysis plugin not available"}
+
+        result = await analysis_plugin.execute('analysis', tool_name, args)
+        return cast(Dict[str, Any], result)
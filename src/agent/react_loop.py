@@ -2,7 +2,7 @@
 
 import asyncio
 import time
-from typing import List, Tuple, Dict, Any, Optional
+from typing import List, Tuple, Dict, Any, Awaitable, Callable, Optional
 from .artifacts import ArtifactGenerator
 from .plugin_executor import PluginExecutor
 from .react_responses import (
@@ -24,13 +24,49 @@ from .react_codebase_analyzer import execute_codebase_analysis
 
 logger = ToolMetrics.get_logger()
 
+# Markers that turn a streamed reply into a tool request; nothing from the
+# first marker on is forwarded to the client.
+_TOOL_MARKERS = ('tool_call:', 'tool call:', '<invoke name="use_mcp_tool">')
+_MARKER_HOLDBACK = max(len(marker) for marker in _TOOL_MARKERS)
+
+
+async def _stream_draft(
+    stream_reply: Callable[[str], Any],
+    prompt: str,
+    on_delta: Callable[[str], Awaitable[None]],
+) -> str:
+    """Collect a streamed reply, forwarding text to ``on_delta`` as it arrives.
+
+    A short tail is held back so a tool marker split across tokens is never
+    forwarded. Returns the complete reply text.
+    """
+    parts: List[str] = []
+    pending = ""
+    forwarding = True
+    async for token in stream_reply(prompt):
+        parts.append(token)
+        if not forwarding:
+            continue
+        pending += token
+        lowered = pending.lower()
+        if any(marker in lowered for marker in _TOOL_MARKERS):
+            forwarding = False
+            continue
+        if len(pending) > _MARKER_HOLDBACK:
+            await on_delta(pending[:-_MARKER_HOLDBACK])
+            pending = pending[-_MARKER_HOLDBACK:]
+    if forwarding and pending:
+        await on_delta(pending)
+    return "".join(parts)
+
 
 async def execute_react_loop(
     user_input: str,
     agent: Any,
     plugin_executor: Any,
     max_iterations: int = 3,  # Reduced from 5 for faster responses
-    timeout: float = 30.0  # Overall timeout to prevent hanging
+    timeout: float = 30.0,  # Overall timeout to prevent hanging
+    on_delta: Optional[Callable[[str], Awaitable[None]]] = None
 ) -> Tuple[str, Optional[str]]:
     """
     Execute ReAct (Reasoning + Acting) loop with special handling for codebase queries.
@@ -46,6 +82,8 @@ async def execute_react_loop(
         plugin_executor: PluginExecutor for tool execution
         max_iterations: Maximum number of ReAct iterations (default: 3, faster than 5)
         timeout: Overall timeout in seconds to prevent hanging (default: 30s)
+        on_delta: Optional coroutine receiving draft text of the first LLM reply
+            as it streams; the returned final response supersedes the draft
 
     Returns:
         Tuple of (final_response, artifact_html)
@@ -365,8 +403,13 @@ async def execute_react_loop(
             # Normal question processing
             if iteration == 1:
                 try:
+                    stream_reply = getattr(agent, 'stream_response', None)
+                    if on_delta is not None and stream_reply is not None:
+                        first_call = _stream_draft(stream_reply, user_input, on_delta)
+                    else:
+                        first_call = agent.generate_response(prompt=user_input)
                     response = await asyncio.wait_for(
-                        agent.generate_response(prompt=user_input),
+                        first_call,
                         timeout=15.0  # First attempt gets 15 seconds
                     )
                     final_response = response
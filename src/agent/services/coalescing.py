@@ -0,0 +1,75 @@
+"""Coalesce identical concurrent plugin calls into one upstream execution."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Dict, Set, Tuple
+
+from ..plugin_executor import PluginExecutor
+
+_CallKey = Tuple[str, str, str]
+
+
+class CoalescingExecutor:
+    """Wrap a PluginExecutor so duplicate in-flight calls share one result.
+
+    Calls are keyed on ``(server, tool_name, args)``. While a call for a key
+    is running, later callers await the same future instead of hitting the
+    plugin again; the entry is dropped as soon as the call settles, so this
+    never serves stale data. Callers receive the same result object and
+    must treat it as read-only.
+    """
+
+    def __init__(self, executor: PluginExecutor, window: float = 0.0) -> None:
+        self._executor = executor
+        self._window = window
+        self._inflight: Dict[_CallKey, asyncio.Future[Dict[str, Any]]] = {}
+        self._tasks: Set[asyncio.Task[None]] = set()
+
+    @property
+    def executor(self) -> PluginExecutor:
+        """The wrapped executor."""
+        return self._executor
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_executor":
+            raise AttributeError(name)
+        return getattr(self._executor, name)
+
+    async def execute(self, server: str, tool_name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a tool, joining an identical in-flight call when present."""
+        key = (server, tool_name, json.dumps(args, sort_keys=True, default=str))
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[key] = future
+            task = asyncio.create_task(self._run(key, future, server, tool_name, args))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        # Shield so one cancelled waiter does not cancel the shared call.
+        return await asyncio.shield(future)
+
+    async def _run(
+        self,
+        key: _CallKey,
+        future: asyncio.Future[Dict[str, Any]],
+        server: str,
+        tool_name: str,
+        args: Dict[str, Any],
+    ) -> None:
+        try:
+            if self._window:
+                # Hold the slot briefly so near-simultaneous callers can join.
+                await asyncio.sleep(self._window)
+            result = await self._executor.execute(server, tool_name, args)
+        except BaseException as exc:  # noqa: BLE001 - fan the failure out to every waiter
+            if not future.done():
+                future.set_exception(exc)
+            # Mark retrieved so an unobserved failure does not log a warning.
+            future.exception()
+        else:
+            if not future.done():
+                future.set_result(result)
+        finally:
+            self._inflight.pop(key, None)
@@ -6,6 +6,7 @@ from typing import Optional
 
 from ...models import Session
 from ...plugin_executor import PluginExecutor
+from ..coalescing import CoalescingExecutor
 import sys
 import os
 # Ensure the src directory is in the path for correct module resolution
@@ -17,7 +18,7 @@ from ..api import AgentAPI as api_module
 
 
 _agent_instance: Optional["api_module.AgentAPI"] = None
-_plugin_executor: Optional[PluginExecutor] = None
+_plugin_executor: Optional[CoalescingExecutor] = None
 
 
 def get_agent():
@@ -26,12 +27,16 @@ def get_agent():
     if _agent_instance is None:
         session = Session(id="openwebui", history=[])
         _agent_instance = api_module.AgentAPI(session)
-        _plugin_executor = PluginExecutor()
+        _plugin_executor = CoalescingExecutor(PluginExecutor())
     return _agent_instance
 
 
-def get_plugin_executor() -> PluginExecutor:
-    """Return the plugin executor paired with the agent instance."""
+def get_plugin_executor() -> CoalescingExecutor:
+    """Return the plugin executor paired with the agent instance.
+
+    Identical tool calls from concurrent requests are coalesced into one
+    upstream execution.
+    """
     global _plugin_executor
     if _plugin_executor is None:
         get_agent()
@@ -3,22 +3,44 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
-from datetime import datetime
+import logging
+import os
+import re
+import time
 from typing import AsyncIterator, List, Optional, Tuple
 
 from ...artifacts import ArtifactGenerator
 from ...plugin_executor import PluginExecutor
-from .models import ChatCompletionChunk, Message
+from ..coalescing import CoalescingExecutor
+from ...utils import json_codec
+from ...utils.ttl_cache import TTLCache
+from .models import Message
+
+logger = logging.getLogger(__name__)
+
+# Number of words packed into each streamed SSE frame.
+STREAM_BATCH_WORDS = max(1, int(os.getenv("STREAM_BATCH_WORDS", "12")))
+
+# Exact-match cache of LLM replies for prompts that did not trigger any tools.
+_RESPONSE_CACHE: TTLCache[str] = TTLCache(maxsize=512, ttl=300)
+
+# First URL in a chat message; trailing punctuation is trimmed after matching.
+_URL_RE = re.compile(r"https?://\S+")
+
+
+def _response_cache_key(model: str, full_prompt: str) -> bytes:
+    return hashlib.blake2b(f"{model}\x00{full_prompt}".encode("utf-8"), digest_size=16).digest()
 
 
 async def execute_tools_if_needed(
     message: str,
     agent: "AgentAPI",
-    plugin_executor: PluginExecutor,
+    plugin_executor: PluginExecutor | CoalescingExecutor,
 ) -> Tuple[str, Optional[str]]:
     """Check message for tool or artifact triggers and execute accordingly."""
-    artifact_type = ArtifactGenerator.detect_artifact_request(message)
+    artifact_type = await ArtifactGenerator.detect_artifact_request(message)
     artifact_html = None
 
     tool_keywords = {
@@ -35,19 +57,38 @@ async def execute_tools_if_needed(
     message_lower = message.lower()
     tool_context = ""
 
+    # Launch every triggered tool call up front so independent I/O overlaps;
+    # results are folded into the context in keyword order afterwards.
+    pending = []
     for keyword, server in tool_keywords.items():
         if keyword not in message_lower:
             continue
 
         if keyword in {"browse", "navigate"}:
-            url = next((word for word in message.split() if word.startswith("http")), None)
+            match = _URL_RE.search(message)
+            url = match.group(0).rstrip(".,)>") if match else None
             if not url:
                 continue
-            result = await plugin_executor.execute(server, "navigate", {"url": url})
+            call = plugin_executor.execute(server, "navigate", {"url": url})
+        elif keyword == "news":
+            call = plugin_executor.execute("news", "get_news", {"topic": "ai", "max_articles": 10})
+        elif keyword in {"time", "date"}:
+            call = plugin_executor.execute("time", "get_current_time", {})
+        else:
+            continue
+        pending.append((keyword, asyncio.create_task(call)))
+
+    results = await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+
+    for (keyword, _), result in zip(pending, results):
+        if isinstance(result, BaseException):
+            tool_context += f"\n[Tool '{keyword}' failed: {result}]\n"
+            continue
+
+        if keyword in {"browse", "navigate"}:
             tool_context += f"\n[Browser Navigation Result: {json.dumps(result)}]\n"
 
         elif keyword == "news":
-            result = await plugin_executor.execute("news", "get_news", {"topic": "ai", "max_articles": 10})
             if result.get("status") == "success":
                 news_result = result.get("result")
             else:
@@ -56,14 +97,13 @@ async def execute_tools_if_needed(
             if news_result and (
                 artifact_type == "html" or "show" in message_lower or "display" in message_lower
             ):
-                artifact_html = ArtifactGenerator.generate_news_page(news_result)
+                artifact_html = await ArtifactGenerator.generate_news_page(news_result)
                 count = len(news_result.get("articles", []))
                 tool_context += f"\n[News fetched: {count} articles - displaying as HTML artifact]\n"
             else:
                 tool_context += f"\n[News Results: {json.dumps(result, indent=2)[:1000]}...]\n"
 
-        elif keyword in {"time", "date"}:
-            result = await plugin_executor.execute("time", "get_current_time", {})
+        else:
             tool_context += f"\n[Current Time: {result}]\n"
 
     if artifact_type == "visualization" and not artifact_html:
@@ -84,7 +124,7 @@ async def execute_tools_if_needed(
 async def stream_response(
     messages: List[Message],
     agent: "AgentAPI",
-    plugin_executor: PluginExecutor,
+    plugin_executor: PluginExecutor | CoalescingExecutor,
     model: str,
     request_id: str,
 ) -> AsyncIterator[str]:
@@ -95,25 +135,64 @@ async def stream_response(
     tool_context, artifact_html = await execute_tools_if_needed(prompt, agent, plugin_executor)
     full_prompt = f"{context}\n{tool_context}\n{prompt}" if tool_context else f"{context}\n{prompt}"
 
-    response = await agent.generate_response(full_prompt, "")
+    # Tool output (time, news, live pages) changes between calls, so only
+    # replies to tool-free prompts are safe to reuse.
+    cache_key = None if tool_context else _response_cache_key(model, full_prompt)
+    response = _RESPONSE_CACHE.get(cache_key) if cache_key else None
+
+    # Chunks share everything but the delta, so serialize plain dicts built
+    # from one per-response header instead of validating a model per frame.
+    header = {
+        "id": request_id,
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+    }
+
+    def frame(content: str, finish_reason: Optional[str] = None) -> str:
+        chunk = {
+            **header,
+            "choices": [
+                {"index": 0, "delta": {"content": content}, "finish_reason": finish_reason}
+            ],
+        }
+        return f"data: {json_codec.dumps(chunk)}\n\n"
+
+    # Forward model tokens as they arrive when the agent can stream, so the
+    # first frame goes out at first-token time rather than after the reply.
+    agent_stream = getattr(agent, "stream_response", None)
+    if response is None and agent_stream is not None:
+        parts: List[str] = []
+        try:
+            async for token in agent_stream(full_prompt, ""):
+                parts.append(token)
+                yield frame(token)
+        except Exception:  # noqa: BLE001 - the client still needs a terminated stream
+            logger.exception("Streaming generation failed for %s", request_id)
+        else:
+            if cache_key:
+                _RESPONSE_CACHE.set(cache_key, "".join(parts))
+            if artifact_html:
+                yield frame(f"\n\n{artifact_html}")
+        yield frame("", "stop")
+        yield "data: [DONE]\n\n"
+        return
+
+    if response is None:
+        response = await agent.generate_response(full_prompt, "")
+        if cache_key:
+            _RESPONSE_CACHE.set(cache_key, response)
+
     if artifact_html:
         response = f"{response}\n\n{artifact_html}"
 
     words = response.split()
-    for index, word in enumerate(words):
-        chunk = ChatCompletionChunk(
-            id=request_id,
-            created=int(datetime.now().timestamp()),
-            model=model,
-            choices=[
-                {
-                    "index": 0,
-                    "delta": {"content": word + " " if index < len(words) - 1 else word},
-                    "finish_reason": None if index < len(words) - 1 else "stop",
-                }
-            ],
-        )
-        yield f"data: {chunk.model_dump_json()}\n\n"
-        await asyncio.sleep(0.05)
+    last_batch_start = (len(words) - 1) // STREAM_BATCH_WORDS * STREAM_BATCH_WORDS
+    for start in range(0, len(words), STREAM_BATCH_WORDS):
+        is_last = start == last_batch_start
+        chunk_text = " ".join(words[start:start + STREAM_BATCH_WORDS])
+        yield frame(chunk_text if is_last else chunk_text + " ", "stop" if is_last else None)
+        # Yield to the event loop between frames without pacing the stream.
+        await asyncio.sleep(0)
 
     yield "data: [DONE]\n\n"
@@ -1,21 +1,52 @@
 """Utilities for loading custom agent instructions."""
 
+import time
 from pathlib import Path
+from typing import Dict, Tuple
 
 
 DEFAULT_RULES_PATH = Path(".clinerules")
 
+# How long a "file is missing" result is trusted before stat-ing again.
+_MISSING_TTL_SECONDS = 5.0
+
+# path -> (mtime, size, text) for files that exist
+_INSTRUCTIONS_CACHE: Dict[Path, Tuple[float, int, str]] = {}
+# path -> monotonic time after which a missing file is re-checked
+_MISSING_UNTIL: Dict[Path, float] = {}
+
 
 def load_custom_instructions(rules_path: Path | str = DEFAULT_RULES_PATH) -> str:
     """Load behavioral overrides from the CLI rules file.
 
-    Returns an empty string if the file does not exist or cannot be read.
+    The file contents are memoized by modification time and size, so repeat
+    calls cost a single ``stat``. Returns an empty string if the file does
+    not exist or cannot be read.
     """
     path = Path(rules_path)
-    if not path.exists():
+    if _MISSING_UNTIL.get(path, 0.0) > time.monotonic():
         return ""
+
     try:
-        return path.read_text(encoding="utf-8")
+        stat = path.stat()
+    except FileNotFoundError:
+        _INSTRUCTIONS_CACHE.pop(path, None)
+        _MISSING_UNTIL[path] = time.monotonic() + _MISSING_TTL_SECONDS
+        return ""
     except OSError as exc:
         print(f"Warning: Could not load {path}: {exc}")
         return ""
+    _MISSING_UNTIL.pop(path, None)
+
+    cached = _INSTRUCTIONS_CACHE.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime, stat.st_size):
+        return cached[2]
+
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError as exc:
+        print(f"Warning: Could not load {path}: {exc}")
+        return ""
+
+    _INSTRUCTIONS_CACHE[path] = (stat.st_mtime, stat.st_size, text)
+    return text
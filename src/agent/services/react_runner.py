@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import AsyncGenerator, Awaitable, Callable
 
 from ..mcp_loader import MCPLoader
@@ -53,7 +54,8 @@ class ReactLoopRunner:
                 print(f"  - {tool.name} ({tool.server})")
 
         while True:
-            user_input = input("You: ").strip()
+            # Read stdin on a worker thread so background tasks keep running.
+            user_input = (await asyncio.to_thread(input, "You: ")).strip()
             if user_input.lower() in ["exit", "quit"]:
                 if self._on_exit:
                     await self._on_exit()
@@ -70,4 +72,4 @@ class ReactLoopRunner:
                 yield f"Error during processing: {exc}. Please try again."
                 continue
 
-            self._memory_store.save_session(self._session)
+            await asyncio.to_thread(self._memory_store.save_session, self._session)
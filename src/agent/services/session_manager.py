@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import uuid
+import secrets
+import time
 from typing import Optional
 
 from ..memory import MemoryStoreFileImpl
@@ -16,7 +17,9 @@ class SessionManager:
         self._memory_store = memory_store
 
     def new_session_id(self) -> str:
-        return str(uuid.uuid4())
+        # Wall-clock prefix keeps ids unique across restarts (sessions persist
+        # to disk) and sortable; the random suffix separates same-ns calls.
+        return f"{time.time_ns():x}{secrets.token_hex(6)}"
 
     def load(self, session_id: str) -> Session:
         existing = self._memory_store.load_session(session_id)
@@ -4,16 +4,37 @@ from __future__ import annotations
 
 import asyncio
 import json
-from typing import Any, Dict, Iterable, List
+import logging
+from typing import Any, Dict, Iterable, List, Tuple
 
 from ..models import MCPTool, Session
 from ..plugin_executor import PluginExecutor
+from .coalescing import CoalescingExecutor
+from ..utils import json_codec
+from ..utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Read-only tools whose successful results may be reused, with their TTL in
+# seconds. Anything not listed (browser actions, writes) always executes.
+_RESULT_TTLS: Dict[Tuple[str, str], float] = {
+    ("time", "get_current_time"): 1.0,
+    ("time", "get_current_date"): 1.0,
+    ("time", "get_day_info"): 1.0,
+    ("news", "get-news"): 60.0,
+    ("enhanced-news", "get_enhanced_news"): 60.0,
+    ("enhanced-news", "discover_sources"): 60.0,
+    ("search", "web_search"): 30.0,
+}
 
 
 class ToolDispatcher:
     """Executes MCP tools and records results on the session."""
 
-    def __init__(self, executor: PluginExecutor):
+    # Shared across dispatchers so repeated chat turns reuse recent results.
+    _result_cache: TTLCache[Dict[str, Any]] = TTLCache(maxsize=256, ttl=30.0)
+
+    def __init__(self, executor: PluginExecutor | CoalescingExecutor):
         self._executor = executor
 
     async def execute_many(
@@ -23,14 +44,19 @@ class ToolDispatcher:
         args_dict: Dict[str, Dict[str, Any]],
     ) -> List[str]:
         tasks = []
+        debug = logger.isEnabledFor(logging.DEBUG)
         for tool_name in tool_names:
-            print(f"DEBUG: Looking for tool '{tool_name}'")
-            print(f"DEBUG: Available tools: {[t.name for t in session.loaded_tools]}")
             tool = self._find_tool(session, tool_name)
             if tool is None:
-                print(f"DEBUG: Tool '{tool_name}' not found")
+                if debug:
+                    logger.debug(
+                        "Tool %r not found; available: %s",
+                        tool_name,
+                        [loaded.name for loaded in session.loaded_tools],
+                    )
                 continue
-            print(f"DEBUG: Found tool: {tool.name}")
+            if debug:
+                logger.debug("Dispatching tool %r to %s.%s", tool_name, tool.server, tool.tool_name)
             tool_args = args_dict.get(tool_name, {})
             tasks.append(self.execute_single(session, tool, tool_args))
 
@@ -38,12 +64,9 @@ class ToolDispatcher:
             return ["No matching tools found."]
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
-        output: List[str] = []
-        for result in results:
-            if isinstance(result, BaseException):
-                output.append(f"Error: {result}")
-            else:
-                output.append(str(result))
+        output: List[str] = [""] * len(results)
+        for index, result in enumerate(results):
+            output[index] = f"Error: {result}" if isinstance(result, BaseException) else str(result)
         return output
 
     async def execute_single(
@@ -53,18 +76,18 @@ class ToolDispatcher:
         args: Dict[str, Any],
     ) -> str:
         try:
-            result = await self._executor.execute(tool.server, tool.tool_name, args)
+            result = await self._execute_cached(tool, args)
         except Exception as exc:  # noqa: BLE001 - surface plugin errors
             error = {"error": str(exc)}
             session.history.append({"role": "assistant", "content": f"Tool execution error: {exc}"})
-            return json.dumps(error)
+            return json_codec.dumps(error)
 
         if result.get("status") == "success":
             payload = result.get("result", {})
             session.history.append(
-                {"role": "assistant", "content": f"Tool {tool.name}: {json.dumps(payload)}"}
+                {"role": "assistant", "content": f"Tool {tool.name}: {json_codec.dumps(payload)}"}
             )
-            return json.dumps(payload, indent=2)
+            return json_codec.dumps(payload, indent=True)
 
         error_message = result.get("error", "Unknown error")
         session.history.append(
@@ -72,6 +95,26 @@ class ToolDispatcher:
         )
         return f"Tool error: {error_message}"
 
+    async def _execute_cached(self, tool: MCPTool, args: Dict[str, Any]) -> Dict[str, Any]:
+        ttl = _RESULT_TTLS.get((tool.server, tool.tool_name))
+        if ttl is None:
+            return await self._executor.execute(tool.server, tool.tool_name, args)
+
+        key = (tool.server, tool.tool_name, json.dumps(args, sort_keys=True, default=str))
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = await self._executor.execute(tool.server, tool.tool_name, args)
+        if result.get("status") == "success":
+            self._result_cache.set(key, result, ttl=ttl)
+        return result
+
     @staticmethod
     def _find_tool(session: Session, tool_name: str) -> MCPTool | None:
+        tools_by_name = getattr(session, "tools_by_name", None)
+        if tools_by_name is not None and tool_name in tools_by_name:
+            return tools_by_name[tool_name]
+        # The index is rebuilt only on assignment; tools appended in place
+        # to ``loaded_tools`` are still found by the scan.
         return next((tool for tool in session.loaded_tools if tool.name == tool_name), None)
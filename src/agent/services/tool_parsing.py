@@ -6,9 +6,9 @@ import re
 from typing import Dict, List, Tuple
 
 
-_TOOL_CALL_PATTERN = re.compile(r"USE TOOL: ([\\w-]+)(.*?)(?=USE TOOL:|$)", re.DOTALL)
-_ARG_PATTERN = re.compile(r"^(\\w+):\\s*(.+)$", re.MULTILINE)
-_PATH_PATTERN = re.compile(r"path:\s*(\\S+)")
+_TOOL_CALL_PATTERN = re.compile(r"USE TOOL: ([\w-]+)(.*?)(?=USE TOOL:|$)", re.DOTALL | re.ASCII)
+_ARG_PATTERN = re.compile(r"^(\w+):\s*(.+)$", re.MULTILINE | re.ASCII)
+_PATH_PATTERN = re.compile(r"path:\s*(\S+)", re.ASCII)
 
 
 def parse_tool_calls(response: str) -> Tuple[List[str], Dict[str, Dict[str, str]]]:
@@ -16,13 +16,14 @@ def parse_tool_calls(response: str) -> Tuple[List[str], Dict[str, Dict[str, str]
     tool_names: List[str] = []
     args_dict: Dict[str, Dict[str, str]] = {}
 
-    for tool_name, section in _TOOL_CALL_PATTERN.findall(response):
+    for tool_match in _TOOL_CALL_PATTERN.finditer(response):
+        tool_name = tool_match.group(1)
         tool_names.append(tool_name)
-        matches = _ARG_PATTERN.findall(section)
-        if matches:
-            args_dict[tool_name] = {key.strip(): value.strip() for key, value in matches}
-        else:
-            args_dict[tool_name] = {}
+        # Keys are already \w+; the greedy \s* leaves only trailing space on values.
+        args: Dict[str, str] = {}
+        for arg_match in _ARG_PATTERN.finditer(tool_match.group(2)):
+            args[arg_match.group(1)] = arg_match.group(2).rstrip()
+        args_dict[tool_name] = args
 
     return tool_names, args_dict
 
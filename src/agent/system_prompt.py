@@ -4,55 +4,17 @@ Contains the model-agnostic prompt template with dynamic context injection.
 """
 
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, Final, List, Optional, Tuple
 
 
-def get_system_prompt(
-    company_name: str = "Anthropic",
-    model_name: str = "Claude",
-    model_family: str = "Claude",
-    model_string: str = "claude-3-5-sonnet-20241022",
-    support_url: str = "https://support.anthropic.com",
-    docs_url: str = "https://docs.anthropic.com",
-    prompting_docs_url: str = "https://docs.anthropic.com/en/docs/build-with-claude/prompt-engineering",
-    api_endpoint: str = "https://api.anthropic.com/v1/messages",
-    user_location: str = "Unknown",
-    available_mcp_tools: Optional[List[Dict]] = None,
-    chat_url: str = "https://claude.ai"
-) -> str:
-    """
-    Generate the complete system prompt with dynamic context.
-    
-    Args:
-        company_name: Name of the company providing the model
-        model_name: Display name of the model
-        model_family: Family/series of the model
-        model_string: API model identifier
-        support_url: URL for user support
-        docs_url: URL for API documentation
-        prompting_docs_url: URL for prompting guide
-        api_endpoint: API endpoint for model completion
-        user_location: User's location for context
-        available_mcp_tools: List of available MCP tools with metadata
-        chat_url: Base URL for chat interface
-    
-    Returns:
-        Complete system prompt string
-    """
-    
-    current_date = datetime.now().strftime("%A, %B %d, %Y")
-    knowledge_cutoff = "end of January 2025"
-    
-    # Format MCP tools section if available
-    mcp_tools_section = ""
-    if available_mcp_tools:
-        mcp_tools_section = "\n\n**AVAILABLE MCP TOOLS**\n"
-        for tool in available_mcp_tools:
-            mcp_tools_section += f"\n- **{tool.get('name')}**: {tool.get('description', 'No description')}\n"
-            if tool.get('parameters'):
-                mcp_tools_section += f"  Parameters: {tool.get('parameters')}\n"
-    
-    prompt = f"""**ASSISTANT INFO**
+# (name, description, parameters) rendered to text so the tool list is hashable
+_FrozenTools = Tuple[Tuple[str, str, str], ...]
+
+_KNOWLEDGE_CUTOFF: Final[str] = "end of January 2025"
+
+# Static prompt text, built once at import; only the placeholders vary per call.
+_PROMPT_TEMPLATE: Final[str] = """**ASSISTANT INFO**
 The assistant is a large language model from {company_name}.
 The assistant's knowledge cutoff date is the {knowledge_cutoff}. The current date is {current_date}.
 
@@ -190,8 +152,101 @@ If the assistant notices signs of mental health issues like mania, psychosis, or
 
 The assistant is now being connected with a person.
 """
+
+
+def get_system_prompt(
+    company_name: str = "Anthropic",
+    model_name: str = "Claude",
+    model_family: str = "Claude",
+    model_string: str = "claude-3-5-sonnet-20241022",
+    support_url: str = "https://support.anthropic.com",
+    docs_url: str = "https://docs.anthropic.com",
+    prompting_docs_url: str = "https://docs.anthropic.com/en/docs/build-with-claude/prompt-engineering",
+    api_endpoint: str = "https://api.anthropic.com/v1/messages",
+    user_location: str = "Unknown",
+    available_mcp_tools: Optional[List[Dict]] = None,
+    chat_url: str = "https://claude.ai"
+) -> str:
+    """
+    Generate the complete system prompt with dynamic context.
     
-    return prompt
+    Args:
+        company_name: Name of the company providing the model
+        model_name: Display name of the model
+        model_family: Family/series of the model
+        model_string: API model identifier
+        support_url: URL for user support
+        docs_url: URL for API documentation
+        prompting_docs_url: URL for prompting guide
+        api_endpoint: API endpoint for model completion
+        user_location: User's location for context
+        available_mcp_tools: List of available MCP tools with metadata
+        chat_url: Base URL for chat interface
+    
+    Returns:
+        Complete system prompt string
+    """
+
+    current_date = datetime.now().strftime("%A, %B %d, %Y")
+    return _build_system_prompt(
+        company_name,
+        model_name,
+        model_family,
+        model_string,
+        user_location,
+        current_date,
+        _render_mcp_tools_section(_freeze_tools(available_mcp_tools)),
+    )
+
+
+def _freeze_tools(available_mcp_tools: Optional[List[Dict]]) -> _FrozenTools:
+    """Convert tool metadata dicts into a hashable cache key."""
+    if not available_mcp_tools:
+        return ()
+    return tuple(
+        (
+            f"{tool.get('name')}",
+            f"{tool.get('description', 'No description')}",
+            f"{tool.get('parameters')}" if tool.get('parameters') else "",
+        )
+        for tool in available_mcp_tools
+    )
+
+
+@lru_cache(maxsize=64)
+def _render_mcp_tools_section(tools: _FrozenTools) -> str:
+    """Render the MCP tools block injected into the prompt."""
+    if not tools:
+        return ""
+    parts = ["\n\n**AVAILABLE MCP TOOLS**\n"]
+    for name, description, parameters in tools:
+        parts.append(f"\n- **{name}**: {description}\n")
+        if parameters:
+            parts.append(f"  Parameters: {parameters}\n")
+    return "".join(parts)
+
+
+@lru_cache(maxsize=64)
+def _build_system_prompt(
+    company_name: str,
+    model_name: str,
+    model_family: str,
+    model_string: str,
+    user_location: str,
+    current_date: str,
+    mcp_tools_section: str,
+) -> str:
+    """Assemble the prompt; cached per argument set and calendar day."""
+    return _PROMPT_TEMPLATE.format_map({
+        "company_name": company_name,
+        "model_name": model_name,
+        "model_family": model_family,
+        "model_string": model_string,
+        "user_location": user_location,
+        "current_date": current_date,
+        "knowledge_cutoff": _KNOWLEDGE_CUTOFF,
+        "mcp_tools_section": mcp_tools_section,
+    })
 
 
 def get_mcp_tool_info(tool_config: Dict) -> Dict:
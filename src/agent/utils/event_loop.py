@@ -0,0 +1,33 @@
+"""Event-loop selection with an optional uvloop fast path."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from typing import Any, Callable, Coroutine, Optional, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional speedup
+    uvloop = None  # type: ignore[assignment]
+
+T = TypeVar("T")
+
+
+def loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """Return uvloop's loop factory when installed and not opted out.
+
+    Set ``AGENT_DISABLE_UVLOOP=1`` to keep the stdlib event loop.
+    """
+    if uvloop is None or sys.platform == "win32":
+        return None
+    if os.getenv("AGENT_DISABLE_UVLOOP", "").lower() in ("1", "true", "yes"):
+        return None
+    return uvloop.new_event_loop
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Drop-in for ``asyncio.run`` that uses uvloop when available."""
+    with asyncio.Runner(loop_factory=loop_factory()) as runner:
+        return runner.run(main)
@@ -0,0 +1,32 @@
+"""JSON encode/decode helpers with an optional orjson fast path."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(payload: Any, *, indent: bool = False) -> str:
+    """Serialize ``payload`` to a JSON string.
+
+    Uses orjson when installed and falls back to the stdlib encoder with
+    compact separators (or two-space indentation when ``indent`` is set).
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(payload, option=option, default=str).decode()
+    if indent:
+        return json.dumps(payload, indent=2, default=str)
+    return json.dumps(payload, separators=(",", ":"), default=str)
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
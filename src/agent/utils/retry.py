@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import random
+from functools import lru_cache
 from typing import Awaitable, Callable, Iterable, Tuple, TypeVar
 
 T = TypeVar("T")
@@ -17,17 +18,28 @@ async def retry_async(
     max_delay: float = 5.0,
     jitter: float = 0.1,
     exceptions: Tuple[type[BaseException], ...] = (Exception,),
+    sleep: Callable[[float], Awaitable[object]] = asyncio.sleep,
 ) -> T:
-    """Retry an async operation with exponential backoff."""
+    """Retry an async operation with exponential backoff.
+
+    ``sleep`` can be swapped for a no-op coroutine in tests.
+    """
+    delays = _backoff_schedule(base_delay, max_delay, retries)
     attempt = 0
     while True:
         try:
             return await operation()
-        except exceptions as exc:
+        except exceptions:
             attempt += 1
             if attempt > retries:
                 raise
-            delay = min(max_delay, base_delay * (2 ** (attempt - 1)))
+            delay = delays[attempt - 1]
             if jitter:
-                delay += random.uniform(0, jitter)
-            await asyncio.sleep(delay)
+                delay += random.random() * jitter
+            await sleep(delay)
+
+
+@lru_cache(maxsize=32)
+def _backoff_schedule(base_delay: float, max_delay: float, retries: int) -> Tuple[float, ...]:
+    """Return the capped exponential delay before each retry."""
+    return tuple(min(max_delay, base_delay * (1 << index)) for index in range(retries))
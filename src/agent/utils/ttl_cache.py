@@ -0,0 +1,52 @@
+"""Small in-process LRU cache with per-entry expiry."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """Bounded mapping whose entries expire ``ttl`` seconds after insertion.
+
+    Least-recently-used entries are evicted once ``maxsize`` is reached.
+    Not thread-safe; intended for use from a single event loop.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        """Return the cached value for ``key`` or ``default`` if missing/expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        """Store ``value`` under ``key``, optionally overriding the default TTL."""
+        lifetime = self.ttl if ttl is None else ttl
+        self._data[key] = (time.monotonic() + lifetime, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._data.clear()
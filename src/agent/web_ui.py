@@ -3,9 +3,12 @@
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse, FileResponse
 from fastapi.middleware.cors import CORSMiddleware
-import json
-import re
-from typing import Optional, List, Tuple
+import asyncio
+import base64
+import hashlib
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, List, Tuple
 from pathlib import Path
 from .models import Session
 from .plugin_executor import PluginExecutor
@@ -15,12 +18,143 @@ import os
 src_dir = os.path.join(os.path.dirname(__file__), '..', '..')
 if src_dir not in sys.path:
     sys.path.insert(0, src_dir)
+# plugins.* is imported as a top-level package from src/
+plugins_dir = str(Path(__file__).parent.parent)
+if plugins_dir not in sys.path:
+    sys.path.insert(0, plugins_dir)
 
 from agent.api import AgentAPI as api_module
+from ._artifact_extract import extract_artifact
 from .artifacts import ArtifactGenerator
 from .mcp_loader import MCPLoader
+from plugins.kokoro_tts import get_tts
+from .utils import json_codec
+from .utils.ttl_cache import TTLCache
 
-app = FastAPI(title="MCP AI Agent Web UI")
+logger = logging.getLogger(__name__)
+
+try:
+    import pybase64
+except ImportError:  # pragma: no cover - optional speedup
+    pybase64 = None
+
+try:
+    # Same module path PluginExecutor loads, so the warmed singleton is shared
+    from src.plugins.browser import schedule_warmup
+except ImportError:  # pragma: no cover - playwright not installed
+    schedule_warmup = None
+
+# Replies to repeated chat messages; REACT_CACHE_TTL=0 disables the cache.
+# Entries hold (response, artifact_html, history turns the reply appended).
+_REACT_CACHE_TTL = float(os.getenv("REACT_CACHE_TTL", "300"))
+_react_cache: TTLCache[Tuple[str, Optional[str], Tuple[dict, ...]]] = TTLCache(
+    maxsize=int(os.getenv("REACT_CACHE_MAX_ENTRIES", "256")),
+    ttl=_REACT_CACHE_TTL,
+)
+
+
+def _react_cache_key(session: Optional[Session], user_message: str) -> bytes:
+    """Key a reply on the normalized message and the last history turn.
+
+    Only the most recent turn is digested: it is the context a follow-up
+    like "and its population?" refers to, and it keeps the key O(message)
+    rather than O(conversation).
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if session is not None:
+        digest.update(session.id.encode("utf-8"))
+        if session.history:
+            digest.update(b"\0" + json_codec.dumps(session.history[-1]).encode("utf-8"))
+    normalized = " ".join(user_message.lower().split())
+    digest.update(b"\1" + normalized.encode("utf-8"))
+    return digest.digest()
+
+
+class _ToolCallRecorder:
+    """Forwards to a ``PluginExecutor`` and notes whether any tool ran.
+
+    Tool results (browser pages, news, file edits) are not reproducible,
+    so turns that used tools are never cached.
+    """
+
+    def __init__(self, executor: Optional[PluginExecutor]) -> None:
+        self._executor = executor
+        self.called = False
+
+    async def execute(self, server: str, tool_name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        self.called = True
+        return await self._executor.execute(server, tool_name, args)
+
+
+# Frames a connection may have queued before producers wait on the writer
+_OUTBOX_MAXSIZE = 64
+
+
+async def _enqueue_frame(
+    outbox: "asyncio.Queue[dict]", writer: "asyncio.Task[None]", frame: dict
+) -> None:
+    """Queue ``frame`` for the connection's writer, waiting while the outbox is full.
+
+    Raises ``WebSocketDisconnect`` if the writer stops (the socket failed)
+    while the producer is waiting for room.
+    """
+    try:
+        outbox.put_nowait(frame)
+        return
+    except asyncio.QueueFull:
+        pass
+    put = asyncio.ensure_future(outbox.put(frame))
+    await asyncio.wait({put, writer}, return_when=asyncio.FIRST_COMPLETED)
+    if not put.done():
+        put.cancel()
+        raise WebSocketDisconnect()
+
+
+async def _socket_writer(websocket: WebSocket, outbox: "asyncio.Queue[dict]") -> None:
+    """Send queued frames, folding everything already waiting into one ``batch`` frame."""
+    while True:
+        items = [await outbox.get()]
+        while True:
+            try:
+                item = outbox.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            last = items[-1]
+            if item["type"] == "delta" and last["type"] == "delta":
+                items[-1] = {"type": "delta", "content": last["content"] + item["content"]}
+            else:
+                items.append(item)
+        frame = items[0] if len(items) == 1 else {"type": "batch", "items": items}
+        try:
+            await websocket.send_text(json_codec.dumps(frame))
+        except Exception:  # noqa: BLE001 - the receive loop reports the disconnect
+            logger.debug("WebSocket writer stopped", exc_info=True)
+            return
+
+
+TTS_BASE_URL = "http://localhost:8880"
+
+# Encoded /tts responses keyed by (voice, text digest)
+_tts_cache: TTLCache[dict] = TTLCache(maxsize=256, ttl=3600)
+
+
+def _b64encode(data: bytes) -> str:
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    return base64.b64encode(data).decode('ascii')
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm the browser if configured; release pooled TTS connections on shutdown."""
+    warmup_task = schedule_warmup() if schedule_warmup else None
+    yield
+    if warmup_task and not warmup_task.done():
+        warmup_task.cancel()
+    await get_tts(TTS_BASE_URL).aclose()
+
+
+app = FastAPI(title="MCP AI Agent Web UI", lifespan=lifespan)
 
 # CORS
 app.add_middleware(
@@ -51,7 +185,7 @@ def get_agent() -> "api_module.AgentAPI":
         agent_instance = api_module(session, mcp_tools=mcp_tools)
         plugin_executor = PluginExecutor()
         
-        print(f"✓ Loaded {len(mcp_tools)} MCP tools for web UI")
+        logger.info("Loaded %d MCP tools for web UI", len(mcp_tools))
     return agent_instance
 
 @app.get("/")
@@ -64,28 +198,28 @@ async def get_ui():
 async def text_to_speech(request: dict) -> dict:
     """Generate speech from text using Kokoro TTS."""
     try:
-        # Import here to avoid module-level import issues
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent.parent))
-        from plugins.kokoro_tts import get_tts
-        
         text = request.get('text', '')
         voice = request.get('voice', 'af_sky')
         
         if not text:
             return {"error": "No text provided"}
         
-        tts = get_tts("http://localhost:8880")
+        cache_key = (voice, hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest())
+        cached = _tts_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        tts = get_tts(TTS_BASE_URL)
         audio_bytes = await tts.generate_speech(text, voice)
         
         if audio_bytes:
             # Return base64 encoded audio
-            import base64
-            audio_b64 = base64.b64encode(audio_bytes).decode('utf-8')
-            return {
-                "audio": audio_b64,
+            payload = {
+                "audio": _b64encode(audio_bytes),
                 "format": "mp3"
             }
+            _tts_cache.set(cache_key, payload)
+            return payload
         else:
             return {"error": "TTS generation failed"}
             
@@ -95,12 +229,7 @@ async def text_to_speech(request: dict) -> dict:
 @app.get("/tts/health")
 async def tts_health() -> dict:
     """Check if TTS service is available."""
-    # Import here to avoid module-level import issues
-    import sys
-    sys.path.insert(0, str(Path(__file__).parent.parent))
-    from plugins.kokoro_tts import get_tts
-    
-    tts = get_tts("http://localhost:8880")
+    tts = get_tts(TTS_BASE_URL)
     is_healthy = await tts.health_check()
     return {"available": is_healthy}
 
@@ -112,134 +241,86 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
     global plugin_executor
     
     # Import ReAct loop
-    from .react_loop import execute_react_loop
+    from .react_loop import execute_react_loop, is_news_question, is_time_question
+
+    # Frames are queued and sent by a single writer task
+    outbox: "asyncio.Queue[dict]" = asyncio.Queue(maxsize=_OUTBOX_MAXSIZE)
+    writer = asyncio.create_task(_socket_writer(websocket, outbox))
     
     try:
         while True:
             # Receive message
             data = await websocket.receive_text()
-            message_data = json.loads(data)
+            message_data = json_codec.loads(data)
             
             if message_data['type'] == 'message':
                 user_message = message_data['content']
                 
-                print(f"\n{'='*60}")
-                print(f"USER MESSAGE: {user_message}")
-                print(f"{'='*60}")
-                print("✨ Delegating to autonomous ReAct loop...")
+                logger.info("User message (%d chars); delegating to ReAct loop", len(user_message))
+                logger.debug("User message: %s", user_message)
                 
-                # Execute ReAct loop for FULL autonomous tool usage
-                # ReAct loop will decide which tools to use based on user request
-                response, artifact_html = await execute_react_loop(
-                    user_message,
-                    agent,
-                    plugin_executor,
-                    max_iterations=5
-                )
+                # Time and news answers go stale quickly, so they always rerun.
+                cache_key = None
+                if _REACT_CACHE_TTL > 0 and not (
+                    is_time_question(user_message) or is_news_question(user_message)
+                ):
+                    cache_key = _react_cache_key(agent.session, user_message)
+                cached = _react_cache.get(cache_key) if cache_key else None
+
+                if cached is not None:
+                    # Replay the turns the original reply added, so history
+                    # matches what the client was shown.
+                    response, artifact_html, turns = cached
+                    agent.session.history.extend(turns)
+                else:
+                    # Execute ReAct loop for FULL autonomous tool usage
+                    # ReAct loop will decide which tools to use based on user request
+                    # Draft text streams to the client as "delta" frames; the
+                    # final "message" frame below replaces it.
+                    async def send_delta(text: str) -> None:
+                        await _enqueue_frame(outbox, writer, {"type": "delta", "content": text})
+
+                    tools = _ToolCallRecorder(plugin_executor)
+                    history_len = len(agent.session.history)
+                    response, artifact_html = await execute_react_loop(
+                        user_message,
+                        agent,
+                        tools,
+                        max_iterations=5,
+                        on_delta=send_delta
+                    )
+                    if cache_key and not tools.called:
+                        turns = tuple(agent.session.history[history_len:])
+                        _react_cache.set(cache_key, (response, artifact_html, turns))
                 
                 # Extract artifacts from response
                 # Check for Claude-style artifact format first (from system prompt)
-                artifact_length = len(artifact_html) if artifact_html else 0
-                print(f"🔍 DEBUG: Received artifact_html: {artifact_html is not None} (length: {artifact_length})")
-                print(f"🔍 DEBUG: Analyzing response for artifacts (length: {len(response)})")
-                print(f"🔍 DEBUG: Response preview: {response[:500]}...")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "ReAct artifact_html: %s (length: %d); response length: %d",
+                        artifact_html is not None,
+                        len(artifact_html) if artifact_html else 0,
+                        len(response),
+                    )
+                    logger.debug("Response preview: %s...", response[:500])
 
                 # Only do additional artifact detection if ReAct loop didn't generate one
                 if not artifact_html:
-                    # Pattern 1: Claude-style artifact with MIME type (HTML)
-                    if 'application/vnd.ant.html' in response or 'text/html' in response:
-                        print("🔍 DEBUG: Found Claude-style artifact marker")
-                        # Look for HTML content after the MIME type declaration
-
-                        # Find MIME type line
-                        mime_pattern = r'(application/vnd\.ant\.html|text/html)\s*\n'
-                        mime_match = re.search(mime_pattern, response)
-
-                        if mime_match:
-                            content_start = mime_match.end()
-
-                            # Look for <!DOCTYPE html> or <html
-                            html_match = re.search(r'<!DOCTYPE html>|<html', response[content_start:], re.IGNORECASE)
-                            if html_match:
-                                html_start = content_start + html_match.start()
-
-                                # Find the end - look for closing </html> tag
-                                html_end_match = re.search(r'</html>\s*', response[html_start:], re.IGNORECASE)
-                                if html_end_match:
-                                    html_end = html_start + html_end_match.end()
-                                    artifact_html = response[html_start:html_end].strip()
-                                    print(f"✅ Extracted Claude-style HTML artifact (length: {len(artifact_html)})")
-
-                                    # Remove artifact from response
-                                    response = response[:mime_match.start()] + '\n✅ HTML artifact generated - see right panel! 🎨\n' + response[html_end:]
-
-                    # Pattern 2: Traditional ```html code blocks (fallback)
-                    if not artifact_html and '```html' in response:
-                        print("🔍 DEBUG: Found ```html marker")
-                        # Extract everything between ```html and the next ```
-                        start_marker = response.find('```html')
-                        if start_marker != -1:
-                            content_start = start_marker + len('```html')
-
-                            # Look for closing ```
-                            end_marker = response.find('```', content_start)
-                            if end_marker == -1:
-                                end_marker = len(response)
-
-                            artifact_html = response[content_start:end_marker].strip()
-                            print(f"✅ Extracted HTML from code block (length: {len(artifact_html)})")
-
-                            # Replace in response
-                            response = response[:start_marker] + '\n✅ HTML artifact generated - see right panel! 🎨\n' + response[end_marker+3 if end_marker < len(response)-3 else end_marker:]
-
-                    # Pattern 3: Markdown artifacts (convert to HTML for display)
-                    if not artifact_html and ('text/markdown' in response or 'application/vnd.ant.code' in response):
-                        print("🔍 DEBUG: Found Markdown artifact marker")
-                        # Look for markdown content after MIME type or in code block
-                        if 'text/markdown' in response:
-                            mime_match = re.search(r'text/markdown\s*\n', response)
-                            if mime_match:
-                                content_start = mime_match.end()
-                                # Find next # heading or take rest of content
-                                markdown_content = response[content_start:].strip()
-                                # Convert markdown to simple HTML
-                                artifact_html = f"""
-                                <!DOCTYPE html>
-                                <html>
-                                <head>
-                                    <style>
-                                        body {{ font-family: Arial, sans-serif; padding: 20px; line-height: 1.6; }}
-                                        h1 {{ color: #333; border-bottom: 2px solid #007bff; padding-bottom: 10px; }}
-                                        h2 {{ color: #555; margin-top: 20px; }}
-                                        ul {{ margin-left: 20px; }}
-                                        li {{ margin-bottom: 8px; }}
-                                    </style>
-                                </head>
-                                <body>
-                                    <pre style="white-space: pre-wrap; font-family: inherit;">{markdown_content}</pre>
-                                </body>
-                                </html>
-                                """
-                                print(f"✅ Converted Markdown artifact to HTML (length: {len(artifact_html)})")
-                                response = response[:mime_match.start()] + '\n✅ Markdown artifact generated - see right panel! 📝\n'
-                
-                response = ArtifactGenerator.format_text_response(response)
+                    response, artifact_html = extract_artifact(response)
                 
-                # Send response
-                await websocket.send_json({
-                    "type": "message",
-                    "content": response
-                })
+                if ArtifactGenerator.needs_formatting(response):
+                    response = ArtifactGenerator.format_text_response(response)
                 
-                # Send artifact if generated
+                # Reply and artifact travel in one frame
+                frame = {"type": "message", "content": response}
                 if artifact_html:
-                    await websocket.send_json({
-                        "type": "artifact",
-                        "content": artifact_html
-                    })
+                    frame["artifact"] = artifact_html
+                await _enqueue_frame(outbox, writer, frame)
                 
     except WebSocketDisconnect:
-        print("Client disconnected")
+        logger.info("Client disconnected")
+    finally:
+        writer.cancel()
 
 if __name__ == "__main__":
     import uvicorn
@@ -267,4 +348,7 @@ if __name__ == "__main__":
     Press Ctrl+C to stop
     """)
     
-    uvicorn.run(app, host="0.0.0.0", port=9000, log_level="info")
+    # uvicorn picks up uvloop/httptools from the speedups extra on its own.
+    # ws_max_size caps *inbound* frames: the UI only sends chat messages, so
+    # 1 MiB (vs. the 16 MiB default) bounds what one client can make us buffer.
+    uvicorn.run(app, host="0.0.0.0", port=9000, log_level="info", ws_max_size=1024 * 1024)
@@ -1,9 +1,77 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 import asyncio
+import atexit
+import os
 import re
 import json
+from concurrent.futures import ProcessPoolExecutor
 from .search import SearchPlugin  # If needed for data
 
+_READ_PATH_RE = re.compile(r"path['\"]([^'\"]*)['\"]")
+_NUMBER_RE = re.compile(r'-?(?:\d+(?:\.\d*)?|\.\d+)')
+
+# Code at least this long is parsed in a worker process; below it the IPC
+# round trip costs more than the GIL-bound parse it would offload.
+_PROCESS_POOL_MIN_CODE = 64 * 1024
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Create the shared REPL worker pool on first use."""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        # Reap the workers at interpreter exit; queued parses are dropped.
+        atexit.register(_process_pool.shutdown, cancel_futures=True)
+    return _process_pool
+
+
+def _dispatch_in_worker(tool_name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    """Picklable entry point run inside the worker process."""
+    return ReplPlugin()._dispatch(tool_name, args)
+
+
+_CONSOLE_LOG = 'console.log('
+_QUOTES = '\'"`'
+
+
+def _console_log_args(code: str) -> List[str]:
+    """Return the argument text of each ``console.log(...)`` call in ``code``.
+
+    Single linear scan that tracks paren depth and skips string literals, so
+    nested calls like ``console.log(f(1))`` keep their closing parens and
+    unbalanced input cannot trigger regex backtracking. Unterminated calls
+    are ignored.
+    """
+    args = []
+    pos = code.find(_CONSOLE_LOG)
+    while pos != -1:
+        start = pos + len(_CONSOLE_LOG)
+        depth = 1
+        quote = ''
+        i = start
+        while i < len(code):
+            ch = code[i]
+            if quote:
+                if ch == '\\':
+                    i += 1
+                elif ch == quote:
+                    quote = ''
+            elif ch in _QUOTES:
+                quote = ch
+            elif ch == '(':
+                depth += 1
+            elif ch == ')':
+                depth -= 1
+                if depth == 0:
+                    args.append(code[start:i])
+                    break
+            i += 1
+        else:
+            break
+        pos = code.find(_CONSOLE_LOG, i + 1)
+    return args
+
 # Global artifact storage for REPL-based artifact creation
 artifacts_created = []
 
@@ -28,12 +96,13 @@ class ReplPlugin:
         try:
             # Mock JS env for Python; in full, use PyV8 or similar, here simulate
             # For now, parse console.log, eval simple math/data
-            logs = re.findall(r'console\.log\((.*?)\)', code, re.DOTALL)
+            logs = _console_log_args(code)
             for log in logs:
-                try:
-                    val = eval(log.strip(), {"__builtins__": {}} ) if log.isdigit() or log.replace('.', '').replace('-', '').isdigit() else log
-                    output.append(str(val))
-                except:
+                # Numeric literals are normalized; anything else is echoed as-is
+                literal = log.strip()
+                if _NUMBER_RE.fullmatch(literal):
+                    output.append(str(float(literal) if '.' in literal else int(literal)))
+                else:
                     output.append(log)
 
             # Handle simple imports/math (mathjs sim)
@@ -44,7 +113,7 @@ class ReplPlugin:
             # For file reads, mock window.fs
             if 'window.fs.readFile' in code:
                 # Extract path, mock
-                path_match = re.search(r"path['\"]([^'\"]*)['\"]", code)
+                path_match = _READ_PATH_RE.search(code)
                 if path_match:
                     path = path_match.group(1)
                     mock_content = f"Mock file content for {path}"  # Real would use fs
@@ -82,6 +151,9 @@ class ReplPlugin:
 
     async def execute(self, server: str, tool_name: str, args: Dict[str, Any]) -> Dict[str, Any]:
         """Async MCP interface entry point expected by the plugin executor."""
+        if len(args.get('code', '')) >= _PROCESS_POOL_MIN_CODE:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_get_process_pool(), _dispatch_in_worker, tool_name, args)
         return await asyncio.to_thread(self._dispatch, tool_name, args)
 
 
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+import os
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 from .capabilities import (
     ContentExtractionMixin,
@@ -11,6 +13,8 @@ from .capabilities import (
     NavigationMixin,
     NewsMixin,
 )
+from . import static_fetch
+from .pool import BrowserPool
 from .session import BrowserSession
 
 logger = logging.getLogger(__name__)
@@ -32,6 +36,13 @@ class BrowserPlugin(
         session_timeout: int = 300,
         retry_count: int = 3,
         plugin_logger: Optional[logging.Logger] = None,
+        pool_size: int = 4,
+        prewarm_contexts: int = 2,
+        block_resources: bool = True,
+        cache_responses: bool = True,
+        engine: Optional[str] = None,
+        cdp_endpoint: Optional[str] = None,
+        block_assets: Optional[bool] = None,
     ) -> None:
         resolved_logger = plugin_logger or logger
         super().__init__(
@@ -39,6 +50,13 @@ class BrowserPlugin(
             session_timeout=session_timeout,
             retry_count=retry_count,
             logger=resolved_logger,
+            pool_size=pool_size,
+            prewarm_contexts=prewarm_contexts,
+            block_resources=block_resources,
+            cache_responses=cache_responses,
+            engine=engine,
+            cdp_endpoint=cdp_endpoint,
+            block_assets=block_assets,
         )
 
 
@@ -53,68 +71,140 @@ async def get_browser(headless: bool = False) -> BrowserPlugin:
     return _browser_instance
 
 
+async def warmup(headless: bool = True) -> Optional[BrowserPlugin]:
+    """Start the shared browser ahead of the first tool call.
+
+    Failures are logged rather than raised so a missing browser binary does
+    not take the host process down; the first real call simply retries.
+    """
+    try:
+        browser = await get_browser(headless=headless)
+        await browser.start()
+    except Exception:
+        logger.warning("browser.warmup.failed", exc_info=True)
+        return None
+    return browser
+
+
+def schedule_warmup(headless: bool = True) -> Optional["asyncio.Task[Optional[BrowserPlugin]]"]:
+    """Warm the browser in the background when ``BROWSER_WARMUP`` is enabled."""
+    if os.getenv("BROWSER_WARMUP", "").lower() not in ("1", "true", "yes"):
+        return None
+    return asyncio.create_task(warmup(headless=headless))
+
+
 async def close_browser() -> None:
     """Dispose of the singleton browser instance."""
     global _browser_instance
     if _browser_instance:
         await _browser_instance.close()
         _browser_instance = None
+    await static_fetch.aclose()
+
+
+async def _navigate(browser: BrowserPlugin, args: Dict[str, Any]) -> Dict[str, Any]:
+    return await browser.navigate(
+        args.get("url", ""),
+        wait_selector=args.get("wait_selector"),
+        timeout=args.get("timeout"),
+    )
+
+
+async def _screenshot(browser: BrowserPlugin, args: Dict[str, Any]) -> Dict[str, Any]:
+    return await browser.screenshot(
+        args.get("path"),
+        full_page=args.get("full_page", False),
+        format=args.get("format", "jpeg"),
+        quality=args.get("quality", 70),
+        encoding=args.get("encoding", "base64"),
+    )
+
+
+async def _click(browser: BrowserPlugin, args: Dict[str, Any]) -> Dict[str, Any]:
+    return await browser.click(args.get("selector", ""))
+
+
+async def _fill(browser: BrowserPlugin, args: Dict[str, Any]) -> Dict[str, Any]:
+    return await browser.fill(args.get("selector", ""), args.get("text", ""))
+
+
+async def _extract_text(browser: BrowserPlugin, args: Dict[str, Any]) -> Dict[str, Any]:
+    selector = args.get("selector", "")
+    text = await browser.extract_text(selector)
+    return {"status": "success", "text": text, "selector": selector}
+
+
+async def _get_links(browser: BrowserPlugin, args: Dict[str, Any]) -> Dict[str, Any]:
+    links = await browser.get_links()
+    return {"status": "success", "links": links}
+
+
+async def _get_news(browser: BrowserPlugin, args: Dict[str, Any]) -> Dict[str, Any]:
+    return await browser.get_news_smart(
+        topic=args.get("topic", "ai"),
+        max_articles=args.get("max_articles", 5),
+    )
+
+
+async def _get_content(browser: BrowserPlugin, args: Dict[str, Any]) -> Dict[str, Any]:
+    content = await browser.get_content(max_chars=args.get("max_chars", 500_000))
+    return {"status": "success", "content": content}
+
+
+async def _extract_content(browser: BrowserPlugin, args: Dict[str, Any]) -> Dict[str, Any]:
+    if args.get("url"):
+        return await browser.extract_url(args["url"], wait_selector=args.get("wait_selector"))
+    return await browser.extract_content_smart()
+
+
+async def _close(browser: BrowserPlugin, args: Dict[str, Any]) -> Dict[str, Any]:
+    await close_browser()
+    return {"status": "success", "message": "Browser closed"}
+
+
+ToolHandler = Callable[[BrowserPlugin, Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+# MCP tool names (and their legacy ``browser_`` aliases) to handlers.
+_TOOLS: Dict[str, ToolHandler] = {
+    "navigate": _navigate,
+    "screenshot": _screenshot,
+    "click": _click,
+    "fill": _fill,
+    "extract-text": _extract_text,
+    "get-links": _get_links,
+    "get-news-smart": _get_news,
+    "browser_navigate": _navigate,
+    "browser_screenshot": _screenshot,
+    "browser_get_content": _get_content,
+    "browser_extract_content": _extract_content,
+    "browser_get_news": _get_news,
+    "browser_click": _click,
+    "browser_fill": _fill,
+    "browser_close": _close,
+}
 
 
 async def execute(server: str, tool_name: str, args: Dict[str, Any]) -> Dict[str, Any]:
     """Execute browser commands via the MCP tool interface."""
+    handler = _TOOLS.get(tool_name)
+    if handler is None:
+        return {"status": "error", "error": f"Unknown tool: {tool_name}"}
     try:
         logger.info("browser.execute.start", extra={"tool": tool_name})
         browser = await get_browser(headless=args.get("headless", True))
-
-        if tool_name == "navigate":
-            return await browser.navigate(args.get("url", ""))
-        if tool_name == "screenshot":
-            return await browser.screenshot(args.get("path"))
-        if tool_name == "click":
-            return await browser.click(args.get("selector", ""))
-        if tool_name == "fill":
-            return await browser.fill(args.get("selector", ""), args.get("text", ""))
-        if tool_name == "extract-text":
-            selector = args.get("selector", "")
-            text = await browser.extract_text(selector)
-            return {"status": "success", "text": text, "selector": selector}
-        if tool_name == "get-links":
-            links = await browser.get_links()
-            return {"status": "success", "links": links}
-        if tool_name == "get-news-smart":
-            return await browser.get_news_smart(
-                topic=args.get("topic", "ai"),
-                max_articles=args.get("max_articles", 5),
-            )
-
-        if tool_name == "browser_navigate":
-            return await browser.navigate(args.get("url", ""))
-        if tool_name == "browser_screenshot":
-            return await browser.screenshot(args.get("path"))
-        if tool_name == "browser_get_content":
-            content = await browser.get_content()
-            return {"status": "success", "content": content}
-        if tool_name == "browser_extract_content":
-            return await browser.extract_content_smart()
-        if tool_name == "browser_get_news":
-            return await browser.get_news_smart(
-                topic=args.get("topic", "ai"),
-                max_articles=args.get("max_articles", 5),
-            )
-        if tool_name == "browser_click":
-            return await browser.click(args.get("selector", ""))
-        if tool_name == "browser_fill":
-            return await browser.fill(args.get("selector", ""), args.get("text", ""))
-        if tool_name == "browser_close":
-            await close_browser()
-            return {"status": "success", "message": "Browser closed"}
-
-        return {"status": "error", "error": f"Unknown tool: {tool_name}"}
+        return await handler(browser, args)
 
     except Exception as exc:  # pragma: no cover - defensive logging
         logger.exception("browser.execute.error", extra={"tool": tool_name})
         return {"status": "error", "error": str(exc)}
 
 
-__all__ = ["BrowserPlugin", "get_browser", "close_browser", "execute"]
+__all__ = [
+    "BrowserPlugin",
+    "BrowserPool",
+    "get_browser",
+    "warmup",
+    "schedule_warmup",
+    "close_browser",
+    "execute",
+]
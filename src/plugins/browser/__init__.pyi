@@ -3,13 +3,21 @@ from typing import Any, Protocol
 
 class BrowserClient(Protocol):
     async def goto(self, url: str) -> Any: ...
-    async def screenshot(self, path: str | None = None, full_page: bool = False) -> Any: ...
+    async def screenshot(
+        self,
+        path: str | None = None,
+        full_page: bool = False,
+        format: str = "jpeg",
+        quality: int = 70,
+        encoding: str = "binary",
+    ) -> Any: ...
     async def scroll(self, direction: str | None = None) -> Any: ...
     async def click(self, selector: str) -> Any: ...
     async def fill(self, selector: str, text: str) -> Any: ...
     async def extract_text(self, selector: str) -> Any: ...
     async def get_links(self) -> Any: ...
     async def extract_content_smart(self) -> Any: ...
+    async def extract_url(self, url: str, wait_selector: str | None = None) -> Any: ...
     async def get_news_smart(self, topic: str, max_articles: int) -> Any: ...
 
 
@@ -2,107 +2,255 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import base64
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from playwright.async_api import Page
+
+# Each helper below resolves in a single protocol round-trip; reading
+# attributes through element handles costs one round-trip per node.
+_FIRST_TEXT_JS = "els => els.length ? (els[0].textContent || '') : null"
+_LINKS_JS = """
+els => els
+    .map(a => ({ href: a.getAttribute('href'), text: (a.textContent || '').trim() }))
+    .filter(link => link.href)
+"""
+_OUTER_HTML_JS = "n => document.documentElement.outerHTML.slice(0, n)"
+# Identifies the current document: a reload or navigation gets a new origin
+# time, and reading it is O(1) unlike any walk over the DOM.
+_TIME_ORIGIN_JS = "() => performance.timeOrigin"
+
+_EXTRACT_JS = """
+() => {
+    // One TreeWalker pass collects links, headings and text.
+    // Boilerplate subtrees are rejected wholesale, so the live
+    // DOM (and its layout) is never mutated.
+    const unwantedTags = new Set(['NAV', 'HEADER', 'FOOTER', 'ASIDE']);
+    const unwanted = '.ad, .advertisement, [role="complementary"], .sidebar, .menu,' +
+        '.navigation, [class*="ad-"], [class*="banner"], [id*="ad-"]';
+    const isUnwanted = el => unwantedTags.has(el.tagName) || el.matches(unwanted);
+    const kept = el => {
+        // Generic class matches on <html>/<body> are not boilerplate.
+        for (let node = el; node && node !== document.body; node = node.parentElement) {
+            if (isUnwanted(node)) return false;
+        }
+        return true;
+    };
+
+    const content = Array.from(document.querySelectorAll(
+        'main, article, [role="main"], .content, #content, .main-content,' +
+        '[class*="article"], [class*="post-content"]'
+    )).find(kept) || document.body;
+
+    const links = [];
+    const headings = [];
+    const paragraphs = [];
+    let textLength = 0;
+    const walker = document.createTreeWalker(content, NodeFilter.SHOW_ELEMENT, {
+        acceptNode: el => isUnwanted(el) ? NodeFilter.FILTER_REJECT : NodeFilter.FILTER_ACCEPT
+    });
+    // Stop as soon as every list is full; Python keeps no more.
+    while ((links.length < 50 || headings.length < 20 || textLength < 5000) && walker.nextNode()) {
+        const el = walker.currentNode;
+        const tag = el.tagName;
+        if (tag === 'A') {
+            if (links.length < 50) {
+                const text = (el.innerText || '').trim();
+                const href = el.href;
+                if (text && href && !href.startsWith('javascript:')) links.push({ text, href });
+            }
+        } else if (tag === 'P') {
+            if (textLength < 5000) {
+                const text = (el.innerText || '').trim();
+                paragraphs.push(text);
+                textLength += text.length + 2;
+            }
+        } else if (tag.length === 2 && tag[0] === 'H' && tag[1] >= '1' && tag[1] <= '6') {
+            if (headings.length < 20) {
+                const text = (el.innerText || '').trim();
+                if (text) headings.push({ tag, text });
+            }
+        }
+    }
+
+    const title = (document.querySelector('title') || {}).innerText || document.title || '';
+
+    return {
+        title,
+        text: paragraphs.join('\\n\\n').slice(0, 5000),
+        headings,
+        links
+    };
+}
+"""
+
+
+class ExtractCache:
+    """Small TTL'd LRU of ``extract_content_smart`` results.
+
+    Keyed by page URL plus ``performance.timeOrigin``, so a reload of the
+    same URL misses. In-document changes are not visible in the key: the
+    session clears the cache after clicks, fills and scripts it runs, and the
+    short TTL bounds staleness from pages that update themselves.
+    """
+
+    def __init__(self, max_entries: int = 64, ttl: float = 60.0) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, float], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, key: Tuple[str, float]) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def put(self, key: Tuple[str, float], result: Dict[str, Any]) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+def _write_temp_file(data: bytes, suffix: str) -> str:
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as handle:
+        handle.write(data)
+    return handle.name
 
 
 class ContentExtractionMixin:
     """Provide helpers for working with page content."""
 
-    async def screenshot(self, path: Optional[str] = None) -> Dict[str, Any]:
-        """Capture a screenshot of the current page."""
-        async with self._operation_span("screenshot", path=path) as span:  # type: ignore[attr-defined]
+    async def screenshot(
+        self,
+        path: Optional[str] = None,
+        full_page: bool = False,
+        format: str = "jpeg",
+        quality: int = 70,
+        encoding: str = "binary",
+    ) -> Dict[str, Any]:
+        """Capture a screenshot of the current page.
+
+        Defaults to a JPEG of the visible viewport; pass ``full_page=True`` or
+        ``format="png"`` for the previous full-height lossless capture.
+        Unsaved captures are returned as raw bytes unless ``encoding`` is
+        ``"base64"``, which text-only transports should request, or
+        ``"file"``, which writes a temporary file and returns only its path.
+        """
+        async with self._operation_span("screenshot", path=path, format=format) as span:  # type: ignore[attr-defined]
             await self.ensure_browser_ready()  # type: ignore[attr-defined]
-            screenshot_bytes = await self.page.screenshot(full_page=True)  # type: ignore[attr-defined]
+            screenshot_bytes = await self.page.screenshot(  # type: ignore[attr-defined]
+                full_page=full_page,
+                type=format,
+                quality=quality if format == "jpeg" else None,
+            )
             span["bytes"] = len(screenshot_bytes)
 
+            if not path and encoding == "file":
+                path = await asyncio.to_thread(_write_temp_file, screenshot_bytes, f".{format}")
+            elif path:
+                await asyncio.to_thread(Path(path).write_bytes, screenshot_bytes)
             if path:
-                with open(path, "wb") as file_handle:
-                    file_handle.write(screenshot_bytes)
                 span["status"] = "saved"
                 return {"path": path, "status": "saved"}
 
             span["status"] = "captured"
-            return {"data": screenshot_bytes.hex(), "status": "captured"}
+            if encoding == "base64":
+                data: Any = base64.b64encode(screenshot_bytes).decode("ascii")
+            else:
+                data, encoding = screenshot_bytes, "binary"
+            return {
+                "data": data,
+                "encoding": encoding,
+                "format": format,
+                "status": "captured",
+            }
 
-    async def get_content(self) -> str:
-        """Return the page content as text."""
-        async with self._operation_span("get_content") as span:  # type: ignore[attr-defined]
+    async def get_content(self, max_chars: int = 500_000) -> str:
+        """Return the page HTML, truncated in the page to ``max_chars``."""
+        async with self._operation_span("get_content", max_chars=max_chars) as span:  # type: ignore[attr-defined]
             await self.ensure_browser_ready()  # type: ignore[attr-defined]
-            content = await self.page.content()  # type: ignore[attr-defined]
+            content = await self.page.evaluate(_OUTER_HTML_JS, max_chars)  # type: ignore[attr-defined]
             span["status"] = "success" if content else "empty"
             span["length"] = len(content) if content else 0
             return content
 
-    async def extract_content_smart(self) -> Dict[str, Any]:
-        """Extract the main content of the page, filtering boilerplate."""
+    async def extract_content_smart(self, page: Optional[Page] = None) -> Dict[str, Any]:
+        """Extract the main content of the page, filtering boilerplate.
+
+        ``page`` defaults to the session's interactive page.
+        """
         async with self._operation_span("extract_content") as span:  # type: ignore[attr-defined]
             await self.ensure_browser_ready()  # type: ignore[attr-defined]
+            page = page or self.page  # type: ignore[attr-defined]
 
-            main_content = await self.page.evaluate(  # type: ignore[attr-defined]
-                """
-                () => {
-                    const unwanted = document.querySelectorAll(
-                        'nav, header, footer, aside, .ad, .advertisement,' +
-                        '[role="complementary"], .sidebar, .menu, .navigation,' +
-                        '[class*="ad-"], [class*="banner"], [id*="ad-"]'
-                    );
-                    unwanted.forEach(el => el.remove());
-
-                    const main = document.querySelector(
-                        'main, article, [role="main"], .content, #content, .main-content,' +
-                        '[class*="article"], [class*="post-content"]'
-                    );
-                    const content = main || document.body;
-
-                    const links = Array.from(content.querySelectorAll('a')).map(a => ({
-                        text: (a.innerText || '').trim(),
-                        href: a.href
-                    })).filter(link => link.text && link.href && !link.href.startsWith('javascript:'));
-
-                    const headings = Array.from(content.querySelectorAll('h1, h2, h3, h4, h5, h6')).map(h => ({
-                        tag: h.tagName,
-                        text: (h.innerText || '').trim()
-                    })).filter(h => h.text);
-
-                    const paragraphs = Array.from(content.querySelectorAll('p')).map(p => (p.innerText || '').trim());
-
-                    const title = (document.querySelector('title') || {}).innerText || document.title || '';
-
-                    return {
-                        title,
-                        text: paragraphs.join('\n\n'),
-                        headings,
-                        links
-                    };
-                }
-                """
-            )
+            cache: Optional[ExtractCache] = getattr(self, "extract_cache", None)
+            if cache is not None:
+                key = (page.url, await page.evaluate(_TIME_ORIGIN_JS))
+                cached = cache.get(key)
+                if cached is not None:
+                    span["status"] = cached["status"]
+                    span["cache"] = "hit"
+                    return dict(cached)
+
+            main_content = await page.evaluate(_EXTRACT_JS)
 
             text_value = main_content.get("text", "") if isinstance(main_content, dict) else ""
             links = main_content.get("links", []) if isinstance(main_content, dict) else []
             span["status"] = "success" if text_value else "empty"
             span["links"] = len(links) if isinstance(links, list) else 0
 
-            return {
-                "url": self.page.url,  # type: ignore[attr-defined]
+            result = {
+                "url": page.url,
                 "title": main_content.get("title", "") if isinstance(main_content, dict) else "",
-                "text": text_value[:5000],
-                "headings": (main_content.get("headings", [])[:20] if isinstance(main_content, dict) else []),
-                "links": links[:50] if isinstance(links, list) else [],
+                "text": text_value,
+                "headings": main_content.get("headings", []) if isinstance(main_content, dict) else [],
+                "links": links if isinstance(links, list) else [],
                 "status": "success" if text_value else "empty",
                 "method": "playwright",
             }
+            if cache is not None:
+                cache.put(key, result)
+            return dict(result)
+
+    async def extract_url(self, url: str, wait_selector: Optional[str] = None) -> Dict[str, Any]:
+        """Navigate a leased page to ``url`` and extract it smartly.
+
+        Unlike ``navigate`` followed by ``extract_content_smart`` this leaves
+        the interactive page alone, so concurrent calls run side by side on
+        warm pooled pages instead of queueing behind one tab. Extraction
+        starts once ``wait_selector`` is present or, without one, once the
+        leased page has parsed the new document; never right at commit.
+        """
+        async with self.lease_page() as page:  # type: ignore[attr-defined]
+            nav_result = await self.navigate(url, wait_selector=wait_selector, page=page)  # type: ignore[attr-defined]
+            if nav_result.get("status") != "success":
+                return nav_result
+            return await self.extract_content_smart(page=page)
 
     async def extract_text(self, selector: str) -> str:
         """Extract the text for a specific selector."""
         async with self._operation_span("extract_text", selector=selector) as span:  # type: ignore[attr-defined]
             await self.ensure_browser_ready()  # type: ignore[attr-defined]
-            element = await self.page.query_selector(selector)  # type: ignore[attr-defined]
-            if element:
-                text_value = await element.text_content()
+            text_value = await self.page.eval_on_selector_all(  # type: ignore[attr-defined]
+                selector, _FIRST_TEXT_JS
+            )
+            if text_value is not None:
                 span["status"] = "success" if text_value else "empty"
-                span["length"] = len(text_value) if text_value else 0
-                return text_value or ""
+                span["length"] = len(text_value)
+                return text_value
             span["status"] = "not_found"
             return ""
 
@@ -110,16 +258,12 @@ class ContentExtractionMixin:
         """Return all anchors from the current page."""
         async with self._operation_span("get_links") as span:  # type: ignore[attr-defined]
             await self.ensure_browser_ready()  # type: ignore[attr-defined]
-            links = await self.page.query_selector_all("a")  # type: ignore[attr-defined]
-            result: List[Dict[str, str]] = []
-            for link in links:
-                href = await link.get_attribute("href")
-                text = await link.text_content()
-                if href:
-                    result.append({"href": href, "text": text.strip() if text else ""})
+            result: List[Dict[str, str]] = await self.page.eval_on_selector_all(  # type: ignore[attr-defined]
+                "a", _LINKS_JS
+            )
             span["status"] = "success"
             span["count"] = len(result)
             return result
 
 
-__all__ = ["ContentExtractionMixin"]
+__all__ = ["ContentExtractionMixin", "ExtractCache"]
@@ -8,11 +8,18 @@ from typing import Dict
 class InteractionMixin:
     """Provide user interaction helpers such as click and fill."""
 
+    def _page_changed(self) -> None:
+        """Drop cached extractions; the interactive document may have changed."""
+        cache = getattr(self, "extract_cache", None)
+        if cache is not None:
+            cache.clear()
+
     async def click(self, selector: str) -> Dict[str, str]:
         """Click an element on the current page."""
         async with self._operation_span("click", selector=selector) as span:  # type: ignore[attr-defined]
             await self.ensure_browser_ready()  # type: ignore[attr-defined]
             await self.page.click(selector)  # type: ignore[attr-defined]
+            self._page_changed()
             span["status"] = "clicked"
             return {"selector": selector, "status": "clicked"}
 
@@ -21,6 +28,7 @@ class InteractionMixin:
         async with self._operation_span("fill", selector=selector) as span:  # type: ignore[attr-defined]
             await self.ensure_browser_ready()  # type: ignore[attr-defined]
             await self.page.fill(selector, text)  # type: ignore[attr-defined]
+            self._page_changed()
             span["status"] = "filled"
             return {"selector": selector, "status": "filled"}
 
@@ -3,16 +3,46 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict
+import random
+import re
+from typing import Any, Dict, Optional
+
+from playwright.async_api import Page
+
+# URL fragments that indicate a bot-check interstitial rather than content.
+_CAPTCHA_RE = re.compile(r"sorry|captcha|challenge|verify", re.IGNORECASE)
+
+# Navigation errors a retry cannot fix (Chromium net::ERR_*, Firefox NS_ERROR_*).
+_FATAL_NAVIGATION_RE = re.compile(
+    r"ERR_NAME_NOT_RESOLVED|ERR_INVALID_URL|ERR_CERT_|ERR_SSL_|ERR_UNKNOWN_URL_SCHEME"
+    r"|NS_ERROR_UNKNOWN_HOST|NS_ERROR_MALFORMED_URI|SSL_ERROR_|SEC_ERROR_"
+    r"|invalid URL|Target page, context or browser has been closed"
+)
 
 
 class NavigationMixin:
     """Provide navigation helpers for Playwright pages."""
 
-    async def navigate(self, url: str) -> Dict[str, Any]:  # type: ignore[override]
-        """Navigate to the requested URL with retry and CAPTCHA detection."""
+    async def navigate(
+        self,
+        url: str,
+        wait_selector: Optional[str] = None,
+        page: Optional[Page] = None,
+        timeout: Optional[int] = None,
+    ) -> Dict[str, Any]:  # type: ignore[override]
+        """Navigate to the requested URL with retry and CAPTCHA detection.
+
+        Returns once ``wait_selector`` is present (waiting at most 5s) or,
+        without a selector, once the document has been parsed
+        (``domcontentloaded``); a selector lets callers that need only part
+        of the DOM continue earlier.
+        ``page`` defaults to the session's interactive page and ``timeout``
+        to the context's navigation timeout (15s). Errors such as
+        unresolvable hosts or bad certificates are returned without retrying.
+        """
         async with self._operation_span("navigate", url=url) as span:  # type: ignore[attr-defined]
             await self.ensure_browser_ready()  # type: ignore[attr-defined]
+            page = page or self.page  # type: ignore[attr-defined]
 
             if not url.startswith(("http://", "https://")):
                 url = f"https://{url}"
@@ -21,20 +51,32 @@ class NavigationMixin:
             for attempt in range(self.retry_count):  # type: ignore[attr-defined]
                 span["attempt"] = attempt + 1
                 try:
-                    response = await self.page.goto(  # type: ignore[attr-defined]
+                    response = await page.goto(
                         url,
-                        wait_until="domcontentloaded",
-                        timeout=30000,
+                        wait_until="commit",
+                        timeout=timeout,
                     )
-
-                    current_url = self.page.url.lower()  # type: ignore[attr-defined]
-                    page_title = await self.page.title()  # type: ignore[attr-defined]
-
-                    if any(token in current_url for token in ("sorry", "captcha", "challenge", "verify")):
+                    if wait_selector:
+                        try:
+                            await page.wait_for_selector(wait_selector, timeout=5000)
+                        except Exception:
+                            span["selector_timeout"] = wait_selector
+                    else:
+                        # Callers without a selector may read the DOM next, so
+                        # a committed response alone is not enough.
+                        try:
+                            await page.wait_for_load_state("domcontentloaded", timeout=timeout)
+                        except Exception:
+                            span["load_timeout"] = True
+
+                    current_url = page.url
+                    page_title = await page.title()
+
+                    if _CAPTCHA_RE.search(current_url):
                         span["status"] = "captcha_detected"
                         span["resolved_url"] = current_url
                         return {
-                            "url": self.page.url,  # type: ignore[attr-defined]
+                            "url": page.url,
                             "title": page_title,
                             "status": "captcha_detected",
                             "error": "CAPTCHA challenge detected. Try alternative sources or RSS feeds.",
@@ -42,9 +84,9 @@ class NavigationMixin:
 
                     span["status"] = "success"
                     span["status_code"] = response.status if response else None
-                    span["resolved_url"] = self.page.url  # type: ignore[attr-defined]
+                    span["resolved_url"] = page.url
                     return {
-                        "url": self.page.url,  # type: ignore[attr-defined]
+                        "url": page.url,
                         "title": page_title,
                         "status": "success",
                         "status_code": response.status if response else None,
@@ -55,14 +97,20 @@ class NavigationMixin:
                         "browser.navigate.retry",
                         extra={"operation": "navigate", "attempt": attempt + 1, "error": str(exc)},
                     )
-                    if attempt == self.retry_count - 1:  # type: ignore[attr-defined]
+                    fatal = bool(_FATAL_NAVIGATION_RE.search(str(exc)))
+                    if fatal or attempt == self.retry_count - 1:  # type: ignore[attr-defined]
                         span["status"] = "error"
                         span["error"] = str(exc)
+                        span["fatal"] = fatal
                         return {"url": url, "status": "error", "error": str(exc)}
 
-                    await asyncio.sleep(2**attempt)
-                    await self.close()  # type: ignore[attr-defined]
-                    await self.start()  # type: ignore[attr-defined]
+                    # Abort in-flight subresources so the retry does not queue behind them.
+                    try:
+                        await page.evaluate("() => window.stop()")
+                    except Exception:
+                        pass
+                    # Jittered so concurrent retries against one host spread out.
+                    await asyncio.sleep(min(2**attempt, 4) * (0.5 + random.random()))
 
             return {"url": url, "status": "error", "error": "Navigation failed"}
 
@@ -79,6 +127,10 @@ class NavigationMixin:
         async with self._operation_span("evaluate") as span:  # type: ignore[attr-defined]
             await self.ensure_browser_ready()  # type: ignore[attr-defined]
             result = await self.page.evaluate(script)  # type: ignore[attr-defined]
+            # The script may have changed the document; drop cached extractions.
+            cache = getattr(self, "extract_cache", None)
+            if cache is not None:
+                cache.clear()
             span["status"] = "success"
             return result
 
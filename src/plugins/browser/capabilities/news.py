@@ -2,7 +2,20 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import asyncio
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..static_fetch import fetch_static
+
+# Server-rendered pages yielding fewer headlines than this fall back to the
+# browser, which sees script-inserted content too.
+_MIN_STATIC_ARTICLES = 3
+
+_GOV_TOPIC_RE = re.compile(
+    r"government|shutdown|federal|congress|president|politics|policy|trump|biden|white house",
+    re.IGNORECASE,
+)
 
 
 class NewsMixin:
@@ -14,21 +27,10 @@ class NewsMixin:
             results: List[Dict[str, Any]] = []
             errors: List[str] = []
 
-            url_safe_topic = topic.lower().replace(" ", "-")
-            gov_keywords = [
-                "government",
-                "shutdown",
-                "federal",
-                "congress",
-                "president",
-                "politics",
-                "policy",
-                "trump",
-                "biden",
-                "white house",
-            ]
+            topic_lower = topic.lower()
+            url_safe_topic = topic_lower.replace(" ", "-")
 
-            if any(keyword in topic.lower() for keyword in gov_keywords):
+            if _GOV_TOPIC_RE.search(topic):
                 direct_sites = [
                     "https://www.cnn.com/politics/",
                     "https://www.foxnews.com/politics/",
@@ -47,44 +49,23 @@ class NewsMixin:
 
             span["candidate_sources"] = len(direct_sites)
 
-            for site_url in direct_sites:
-                try:
-                    nav_result = await self.navigate(site_url)  # type: ignore[attr-defined]
-
-                    if nav_result.get("status") == "captcha_detected":
-                        errors.append(f"{site_url}: CAPTCHA detected")
-                        continue
-
-                    if nav_result.get("status") != "success":
-                        errors.append(f"{site_url}: Navigation failed")
-                        continue
-
-                    extracted = await self.extract_content_smart()  # type: ignore[attr-defined]
-
-                    if extracted.get("status") == "success" and extracted.get("links"):
-                        results.append(
-                            {
-                                "source": site_url,
-                                "title": extracted.get("title", ""),
-                                "top_articles": [
-                                    {
-                                        "headline": link.get("text", "")[:100],
-                                        "url": link.get("href", ""),
-                                    }
-                                    for link in extracted["links"][:max_articles]
-                                    if link.get("text") and len(link.get("text", "")) > 10
-                                ],
-                                "summary": extracted.get("text", "")[:800],
-                                "all_headings": extracted.get("headings", [])[:10],
-                            }
-                        )
+            # Probe every source concurrently on leased pages and keep the
+            # first one that yields articles; the rest are cancelled.
+            tasks = [
+                asyncio.create_task(self._scrape_news_site(site_url, max_articles))
+                for site_url in direct_sites
+            ]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    result, error = await next_done
+                    if result is not None:
+                        results.append(result)
                         break
-
-                    errors.append(f"{site_url}: No content extracted")
-
-                except Exception as exc:  # pragma: no cover - network dependent
-                    errors.append(f"{site_url}: {exc}")
-                    continue
+                    errors.append(error)
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
 
             span["status"] = "success" if results else "empty"
             span["sources"] = len(results)
@@ -99,5 +80,56 @@ class NewsMixin:
                 "method": "direct_site_with_extraction",
             }
 
+    async def _scrape_news_site(
+        self, site_url: str, max_articles: int
+    ) -> Tuple[Optional[Dict[str, Any]], str]:
+        """Scrape one source, trying plain HTTP before a leased browser page.
+
+        Returns ``(result, error)``.
+        """
+        static = await fetch_static(site_url)
+        if static is not None:
+            result = _news_result(site_url, static, max_articles)
+            if result and len(result["top_articles"]) >= min(_MIN_STATIC_ARTICLES, max_articles):
+                return result, ""
+
+        try:
+            async with self.lease_page() as page:  # type: ignore[attr-defined]
+                nav_result = await self.navigate(site_url, wait_selector="a", page=page)  # type: ignore[attr-defined]
+
+                if nav_result.get("status") == "captcha_detected":
+                    return None, f"{site_url}: CAPTCHA detected"
+
+                if nav_result.get("status") != "success":
+                    return None, f"{site_url}: Navigation failed"
+
+                extracted = await self.extract_content_smart(page=page)  # type: ignore[attr-defined]
+        except Exception as exc:  # pragma: no cover - network dependent
+            return None, f"{site_url}: {exc}"
+
+        result = _news_result(site_url, extracted, max_articles)
+        if result:
+            return result, ""
+        return None, f"{site_url}: No content extracted"
+
+
+def _news_result(site_url: str, extracted: Dict[str, Any], max_articles: int) -> Optional[Dict[str, Any]]:
+    """Shape an extraction into a news result, or None if it has no links."""
+    if extracted.get("status") != "success" or not extracted.get("links"):
+        return None
+    return {
+        "source": site_url,
+        "title": extracted.get("title", ""),
+        "top_articles": [
+            {
+                "headline": link.get("text", "")[:100],
+                "url": link.get("href", ""),
+            }
+            for link in extracted["links"][:max_articles]
+            if link.get("text") and len(link.get("text", "")) > 10
+        ],
+        "summary": extracted.get("text", "")[:800],
+        "all_headings": extracted.get("headings", [])[:10],
+    }
 
 __all__ = ["NewsMixin"]
@@ -0,0 +1,323 @@
+"""Context pooling for the modular browser plugin."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from playwright.async_api import Browser, BrowserContext, Page, Route
+
+from .response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+ContextFactory = Callable[..., Awaitable[BrowserContext]]
+
+_USER_AGENTS = {
+    "firefox": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) "
+        "Gecko/20100101 Firefox/120.0"
+    ),
+    "chromium": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+}
+
+_VIEWPORT = {"width": 1920, "height": 1080}
+_GEOLOCATION = {"latitude": 40.7128, "longitude": -74.0060}
+
+_EXTRA_HEADERS = {
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Accept": (
+        "text/html,application/xhtml+xml,application/xml;q=0.9,"  # noqa: E501
+        "image/webp,*/*;q=0.8"
+    ),
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Cache-Control": "max-age=0",
+}
+
+# Applied once per context so navigation calls need not pass a timeout.
+_NAVIGATION_TIMEOUT_MS = 15000
+
+_CONTEXT_OPTIONS: Dict[str, Any] = {
+    "viewport": _VIEWPORT,
+    "locale": "en-US",
+    "timezone_id": "America/New_York",
+    "permissions": ["geolocation"],
+    "geolocation": _GEOLOCATION,
+    "extra_http_headers": _EXTRA_HEADERS,
+}
+
+# Injected into every document before page scripts run.
+_STEALTH_JS = """
+Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
+Object.defineProperty(navigator, 'plugins', {
+    get: () => [
+        { name: 'Chrome PDF Plugin', filename: 'internal-pdf-viewer' },
+        { name: 'Chrome PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai' },
+        { name: 'Native Client', filename: 'internal-nacl-plugin' }
+    ]
+});
+Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
+Object.defineProperty(navigator, 'platform', { get: () => 'Win32' });
+window.chrome = { runtime: {} };
+const originalQuery = window.navigator.permissions.query;
+window.navigator.permissions.query = (parameters) => (
+    parameters.name === 'notifications'
+        ? Promise.resolve({ state: Notification.permission })
+        : originalQuery(parameters)
+);
+""".strip()
+
+# Resource types that text/link extraction never reads.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+
+def _storage_state_path() -> Optional[str]:
+    """Where cookies and local storage persist between runs.
+
+    Opt-in via ``BROWSER_STORAGE``: the file holds session cookies for every
+    site visited, so there is no shared default location.
+    """
+    path = os.environ.get("BROWSER_STORAGE")
+    return os.path.expanduser(path) if path else None
+
+
+def _write_json_atomic(path: str, payload: Dict[str, Any]) -> None:
+    # mkstemp creates the temp file 0600 with O_EXCL, so a pre-planted file
+    # or symlink in the directory is never followed.
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=".browser_state.", suffix=".tmp", dir=os.path.dirname(os.path.abspath(path))
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle)
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+async def save_storage_state(contexts: Iterable[BrowserContext]) -> None:
+    """Merge the cookies and origin storage of ``contexts`` into the state file."""
+    path = _storage_state_path()
+    if not path:
+        return
+    cookies: Dict[tuple, Dict[str, Any]] = {}
+    origins: Dict[str, Dict[str, Any]] = {}
+    for context in contexts:
+        try:
+            state = await context.storage_state()
+        except Exception:
+            continue
+        for cookie in state.get("cookies", []):
+            cookies[(cookie.get("name"), cookie.get("domain"), cookie.get("path"))] = cookie
+        for origin in state.get("origins", []):
+            origins[origin.get("origin")] = origin
+    if not cookies and not origins:
+        return
+    try:
+        await asyncio.to_thread(
+            _write_json_atomic,
+            path,
+            {"cookies": list(cookies.values()), "origins": list(origins.values())},
+        )
+    except OSError:
+        logger.warning("browser.storage_state.save_failed", extra={"path": path}, exc_info=True)
+
+
+async def _make_context(
+    browser: Browser,
+    block_resources: bool = False,
+    response_cache: Optional[ResponseCache] = None,
+) -> BrowserContext:
+    """Create a context carrying the plugin's anti-detection configuration.
+
+    With ``block_resources`` the context aborts image, media, font and
+    stylesheet requests, which suits scraping but not screenshots. A
+    ``response_cache`` serves repeat GETs for cacheable responses from memory.
+    Saved cookies and local storage are restored when a state file exists.
+    """
+    options: Dict[str, Any] = {
+        **_CONTEXT_OPTIONS,
+        "user_agent": _USER_AGENTS.get(browser.browser_type.name, _USER_AGENTS["firefox"]),
+    }
+    storage_path = _storage_state_path()
+    if storage_path and os.path.exists(storage_path):
+        try:
+            context = await browser.new_context(storage_state=storage_path, **options)
+        except Exception:
+            # A corrupt or incompatible state file must not block startup.
+            logger.warning("browser.storage_state.discarded", extra={"path": storage_path})
+            try:
+                os.remove(storage_path)
+            except OSError:
+                pass
+            context = await browser.new_context(**options)
+    else:
+        context = await browser.new_context(**options)
+    context.set_default_navigation_timeout(_NAVIGATION_TIMEOUT_MS)
+    await context.add_init_script(_STEALTH_JS)
+    if block_resources or response_cache is not None:
+
+        async def handle_route(route: Route) -> None:
+            if block_resources and route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+                await route.abort()
+            elif response_cache is not None:
+                await response_cache.serve(route)
+            else:
+                await route.continue_()
+
+        await context.route("**/*", handle_route)
+    return context
+
+
+@dataclass
+class _PoolEntry:
+    context: BrowserContext
+    page: Page
+    leases: int = 0
+
+
+class BrowserPool:
+    """Lease isolated pages from one shared browser process.
+
+    Each pooled context owns a single page that is reset to ``about:blank``
+    between leases, so a lease costs neither context nor page creation. At
+    most ``max_size`` pages are leased at once, and a context is rebuilt
+    after ``recycle_after`` leases to bound accumulated page state. Pooled
+    contexts block heavy resources unless ``block_resources`` is False and
+    share ``response_cache`` when one is given.
+    """
+
+    def __init__(
+        self,
+        browser: Browser,
+        max_size: int = 4,
+        context_factory: ContextFactory = _make_context,
+        block_resources: bool = True,
+        response_cache: Optional[ResponseCache] = None,
+        recycle_after: int = 50,
+    ) -> None:
+        self.browser = browser
+        self.max_size = max_size
+        self.block_resources = block_resources
+        self.response_cache = response_cache
+        self.recycle_after = recycle_after
+        self._context_factory = context_factory
+        self._idle: asyncio.Queue[_PoolEntry] = asyncio.Queue()
+        self._slots = asyncio.Semaphore(max_size)
+        self._entries: List[_PoolEntry] = []
+        self._closed = False
+
+    @property
+    def contexts(self) -> List[BrowserContext]:
+        """Contexts currently owned by the pool."""
+        return [entry.context for entry in self._entries]
+
+    @property
+    def size(self) -> int:
+        """Number of contexts currently owned by the pool."""
+        return len(self._entries)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Page]:
+        """Lease a page, resetting and returning it to the pool on exit."""
+        if self._closed:
+            raise RuntimeError("Browser pool is closed")
+
+        async with self._slots:
+            try:
+                entry = self._idle.get_nowait()
+            except asyncio.QueueEmpty:
+                entry = await self._new_entry()
+
+            entry.leases += 1
+            try:
+                yield entry.page
+            finally:
+                await self._release(entry)
+
+    async def prewarm(self, count: int) -> None:
+        """Create idle contexts ahead of demand, up to ``count`` in total."""
+        count = min(count, self.max_size)
+        while not self._closed and self.size < count:
+            # Holding a slot keeps creation within max_size alongside acquire().
+            async with self._slots:
+                if self._closed or self.size >= count:
+                    return
+                entry = await self._new_entry()
+                if self._closed:
+                    await self._discard(entry)
+                    return
+                self._idle.put_nowait(entry)
+
+    async def _new_entry(self) -> _PoolEntry:
+        context = await self._context_factory(
+            self.browser,
+            block_resources=self.block_resources,
+            response_cache=self.response_cache,
+        )
+        entry = _PoolEntry(context=context, page=await context.new_page())
+        self._entries.append(entry)
+        return entry
+
+    async def _release(self, entry: _PoolEntry) -> None:
+        if (
+            self._closed
+            or entry.page.is_closed()
+            or entry.leases >= self.recycle_after
+            or not self.browser.is_connected()
+        ):
+            await self._discard(entry)
+            return
+
+        try:
+            # Popups opened by the lessee would leak into the next lease.
+            for page in list(entry.context.pages):
+                if page is not entry.page:
+                    await page.close()
+            await entry.page.goto("about:blank")
+        except Exception:
+            await self._discard(entry)
+            return
+        self._idle.put_nowait(entry)
+
+    async def _discard(self, entry: _PoolEntry) -> None:
+        if entry in self._entries:
+            self._entries.remove(entry)
+        try:
+            await entry.context.close()
+        except Exception:
+            pass
+
+    async def close(self) -> None:
+        """Close every context owned by the pool."""
+        self._closed = True
+        while not self._idle.empty():
+            self._idle.get_nowait()
+        entries, self._entries = self._entries, []
+        await asyncio.gather(
+            *(entry.context.close() for entry in entries),
+            return_exceptions=True,
+        )
+
+
+__all__ = ["BrowserPool"]
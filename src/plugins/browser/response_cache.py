@@ -0,0 +1,114 @@
+"""In-memory HTTP response cache served through Playwright routes."""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional
+
+from playwright.async_api import Route
+
+_MAX_AGE_RE = re.compile(r"(?:s-maxage|max-age)\s*=\s*(\d+)")
+_UNCACHEABLE_DIRECTIVES = ("no-store", "no-cache", "private")
+# The cached body is stored decoded, so framing headers no longer apply.
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+@dataclass
+class _CachedResponse:
+    expires_at: float
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+
+class ResponseCache:
+    """LRU of cacheable GET responses, bounded by entry count and total bytes.
+
+    Only ``200`` responses whose ``Cache-Control`` grants a positive
+    ``max-age`` are stored; everything else is fetched normally.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, _CachedResponse]" = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def freshness(headers: Mapping[str, str]) -> float:
+        """Return how many seconds a response may be reused, or 0."""
+        cache_control = headers.get("cache-control", "").lower()
+        if not cache_control or any(d in cache_control for d in _UNCACHEABLE_DIRECTIVES):
+            return 0.0
+        match = _MAX_AGE_RE.search(cache_control)
+        return float(match.group(1)) if match else 0.0
+
+    def get(self, url: str) -> Optional[_CachedResponse]:
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._evict(url)
+            return None
+        self._entries.move_to_end(url)
+        return entry
+
+    def put(self, url: str, status: int, headers: Mapping[str, str], body: bytes, ttl: float) -> None:
+        if ttl <= 0 or len(body) > self.max_bytes // 4:
+            return
+        if url in self._entries:
+            self._evict(url)
+        self._entries[url] = _CachedResponse(
+            expires_at=time.monotonic() + ttl,
+            status=status,
+            headers={k: v for k, v in headers.items() if k.lower() not in _DROPPED_HEADERS},
+            body=body,
+        )
+        self._bytes += len(body)
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._evict(next(iter(self._entries)))
+
+    def _evict(self, url: str) -> None:
+        entry = self._entries.pop(url)
+        self._bytes -= len(entry.body)
+
+    async def serve(self, route: Route) -> None:
+        """Answer ``route`` from the cache, or fetch it and cache the result."""
+        request = route.request
+        if request.method != "GET":
+            await route.continue_()
+            return
+
+        cached = self.get(request.url)
+        if cached is not None:
+            self.hits += 1
+            await route.fulfill(status=cached.status, headers=cached.headers, body=cached.body)
+            return
+
+        self.misses += 1
+        try:
+            # Redirects go back to the browser so page.url still tracks them.
+            response = await route.fetch(max_redirects=0)
+            body = await response.body()
+        except Exception:
+            # An unresolved route would stall the page until its timeout; let
+            # the browser make (and fail) the request itself instead.
+            try:
+                await route.continue_()
+            except Exception:
+                pass  # the route was already handled or its context closed
+            return
+        if response.status == 200:
+            self.put(request.url, response.status, response.headers, body, self.freshness(response.headers))
+        await route.fulfill(response=response, body=body)
+
+
+__all__ = ["ResponseCache"]
@@ -4,19 +4,15 @@ from __future__ import annotations
 
 import logging
 import os
+import re
 import signal
 import subprocess
 import sys
 import threading
 import time
 import warnings
-from contextlib import (
-    asynccontextmanager,
-    contextmanager,
-    redirect_stderr,
-    redirect_stdout,
-)
-from typing import Any, AsyncIterator, Dict, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, TextIO
 
 # Apply the same aggressive warning suppression used by the legacy module
 warnings.filterwarnings("ignore")
@@ -107,61 +103,14 @@ class BrowserCleanupManager:
 cleanup_manager = BrowserCleanupManager()
 
 
-@contextmanager
-def suppress_browser_warnings() -> Iterator[None]:
-    """Context manager that filters noisy browser warnings from stdout/stderr."""
-
-    old_stderr = sys.stderr
-    old_stdout = sys.stdout
-
-    class DevNull:
-        def write(self, text: str) -> None:
-            suppressed_tokens = (
-                "BaseSubprocessTransport",
-                "Event loop is closed",
-                "EPIPE: broken pipe",
-                "I/O operation on closed pipe",
-                "RuntimeError: Event loop is closed",
-                "Node.js",
-                "throw er",
-                "Error: EPIPE",
-                "broken pipe",
-                "write EPIPE",
-                "PipeTransport",
-                "dispatcherConnection",
-                "Emitted 'error' event",
-                "fileno",
-                "call_soon",
-                "_check_closed",
-                "proactor_events",
-                "windows_utils",
-            )
-            if not any(token in text for token in suppressed_tokens):
-                old_stderr.write(text)
-
-        def flush(self) -> None:  # pragma: no cover - passthrough flush
-            old_stderr.flush()
-
-    with redirect_stderr(DevNull()), redirect_stdout(DevNull()):
-        yield
-
-    sys.stderr = old_stderr
-    sys.stdout = old_stdout
-
-
-@contextmanager
-def suppress_all_warnings() -> Iterator[None]:
-    """Suppress all noisy warnings during teardown/cleanup."""
-
-    old_stderr = sys.stderr
-    old_stdout = sys.stdout
-
-    class WarningFilter:
-        def __init__(self, stream):
-            self._stream = stream
-
-        def write(self, text: str) -> None:
-            suppressed_patterns = (
+# Compiled once so a filtered write costs one regex search, not a scan per token.
+# Matching is case-insensitive, so "EPIPE" also covers "write EPIPE" and
+# "Error: EPIPE", and "RuntimeError" covers "RuntimeError: Event loop is closed".
+_NOISE_RE = re.compile(
+    "|".join(
+        map(
+            re.escape,
+            (
                 "BaseSubprocessTransport",
                 "Event loop is closed",
                 "I/O operation on closed pipe",
@@ -170,7 +119,6 @@ def suppress_all_warnings() -> Iterator[None]:
                 "Node.js",
                 "RuntimeError",
                 "throw er",
-                "Error: EPIPE",
                 "PipeTransport",
                 "dispatcherConnection",
                 "Emitted 'error' event",
@@ -191,17 +139,36 @@ def suppress_all_warnings() -> Iterator[None]:
                 "websockets",
                 "selenium",
                 "urllib3",
-            )
-            lowered = text.lower()
-            if not any(pattern.lower() in lowered for pattern in suppressed_patterns):
-                self._stream.write(text)
-                self._stream.flush()
+            ),
+        )
+    ),
+    re.IGNORECASE,
+)
+
 
-        def flush(self) -> None:  # pragma: no cover - passthrough flush
+class _FilteredStream:
+    """Text stream wrapper that drops writes matching ``_NOISE_RE``."""
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+
+    def write(self, text: str) -> None:
+        if not _NOISE_RE.search(text):
+            self._stream.write(text)
             self._stream.flush()
 
-    sys.stderr = WarningFilter(old_stderr)
-    sys.stdout = WarningFilter(old_stdout)
+    def flush(self) -> None:  # pragma: no cover - passthrough flush
+        self._stream.flush()
+
+
+@contextmanager
+def suppress_all_warnings() -> Iterator[None]:
+    """Suppress noisy browser and asyncio warnings during teardown/cleanup."""
+
+    old_stderr = sys.stderr
+    old_stdout = sys.stdout
+    sys.stderr = _FilteredStream(old_stderr)
+    sys.stdout = _FilteredStream(old_stdout)
 
     try:
         yield
@@ -210,37 +177,47 @@ def suppress_all_warnings() -> Iterator[None]:
         sys.stdout = old_stdout
 
 
+# Kept for callers of the former narrower filter; the patterns are a superset.
+suppress_browser_warnings = suppress_all_warnings
+
+
 @asynccontextmanager
 async def operation_span(
     operation_logger: logging.Logger,
     operation: str,
     **details: Any,
 ) -> AsyncIterator[Dict[str, Any]]:
-    """Emit structured logs around an async operation and capture metadata."""
+    """Emit structured logs around an async operation and capture metadata.
+
+    Log payloads are only built for levels the logger will emit, so spans
+    around hot calls cost almost nothing while browser logging is quiet.
+    """
 
     start = time.perf_counter()
     metadata: Dict[str, Any] = {"status": "success"}
-    log_details = {"operation": operation, **details}
-    operation_logger.info("browser.%s.start", operation, extra=log_details)
+    if operation_logger.isEnabledFor(logging.INFO):
+        operation_logger.info("browser.%s.start", operation, extra={"operation": operation, **details})
 
     try:
         yield metadata
     except Exception:
-        duration = time.perf_counter() - start
-        operation_logger.exception(
-            "browser.%s.error",
-            operation,
-            extra={**log_details, "status": "error", "duration": round(duration, 3)},
-        )
+        if operation_logger.isEnabledFor(logging.ERROR):
+            duration = time.perf_counter() - start
+            operation_logger.exception(
+                "browser.%s.error",
+                operation,
+                extra={"operation": operation, **details, "status": "error", "duration": round(duration, 3)},
+            )
         raise
     else:
-        duration = time.perf_counter() - start
         status = metadata.get("status", "success")
         level = logging.INFO if status == "success" else logging.WARNING
-        operation_logger.log(
-            level,
-            "browser.%s.%s",
-            operation,
-            status,
-            extra={**log_details, "status": status, "duration": round(duration, 3)},
-        )
+        if operation_logger.isEnabledFor(level):
+            duration = time.perf_counter() - start
+            operation_logger.log(
+                level,
+                "browser.%s.%s",
+                operation,
+                status,
+                extra={"operation": operation, **details, "status": status, "duration": round(duration, 3)},
+            )
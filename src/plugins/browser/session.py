@@ -6,12 +6,63 @@ import asyncio
 import atexit
 import gc
 import logging
-from typing import Any, Dict, Optional
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 
 from playwright.async_api import Browser, BrowserContext, Page, async_playwright
 
+from .capabilities.content import ExtractCache
+from .pool import _USER_AGENTS, BrowserPool, _make_context, save_storage_state
+from .response_cache import ResponseCache
 from .runtime import cleanup_manager, operation_span, suppress_all_warnings
 
+# Container-friendly Chromium flags; Firefox stays the default because it
+# trips fewer bot checks, Chromium starts faster and can be shared over CDP.
+_CHROMIUM_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+)
+
+_FIREFOX_PREFS = {
+    "dom.webdriver.enabled": False,
+    "useAutomationExtension": False,
+    "general.platform.override": "Win32",
+    "general.useragent.override": _USER_AGENTS["firefox"],
+}
+
+
+@dataclass
+class _SharedBrowser:
+    playwright: Any
+    browser: Browser
+    refs: int = 0
+
+
+# One driver and browser process per launch configuration, shared by every
+# session in the process; each session only owns its contexts.
+_SharedKey = Tuple[str, bool, Optional[str]]
+_shared_browsers: Dict[_SharedKey, _SharedBrowser] = {}
+_shared_lock = asyncio.Lock()
+
+# A young-generation pass catches the cyclic Playwright proxies a close
+# leaves behind; a full-heap pass stalls the loop, so only every Nth close.
+_FULL_GC_EVERY = 16
+_closes_since_full_gc = 0
+
+
+def _collect_after_close() -> None:
+    global _closes_since_full_gc
+    _closes_since_full_gc += 1
+    if _closes_since_full_gc >= _FULL_GC_EVERY:
+        _closes_since_full_gc = 0
+        gc.collect()
+    else:
+        gc.collect(1)
+
 
 class BrowserSession:
     """Manage the lifecycle of a Playwright browser session."""
@@ -22,10 +73,32 @@ class BrowserSession:
         session_timeout: int = 300,
         retry_count: int = 3,
         logger: Optional[logging.Logger] = None,
+        pool_size: int = 4,
+        prewarm_contexts: int = 2,
+        block_resources: bool = True,
+        cache_responses: bool = True,
+        engine: Optional[str] = None,
+        cdp_endpoint: Optional[str] = None,
+        block_assets: Optional[bool] = None,
     ) -> None:
         self.headless = headless
+        self.engine = (engine or os.environ.get("BROWSER_ENGINE", "firefox")).lower()
+        self.cdp_endpoint = cdp_endpoint or os.environ.get("BROWSER_CDP_ENDPOINT")
+        if self.cdp_endpoint:
+            self.engine = "chromium"
         self.session_timeout = session_timeout
         self.retry_count = retry_count
+        self.pool_size = pool_size
+        self.prewarm_contexts = prewarm_contexts
+        self.block_resources = block_resources
+        # The interactive page also serves screenshots, so it loads assets
+        # unless asked not to.
+        if block_assets is None:
+            block_assets = os.environ.get("BROWSER_BLOCK_ASSETS", "").lower() in ("1", "true", "yes")
+        self.block_assets = block_assets
+        # Outlives browser restarts so warm entries survive an idle close.
+        self.response_cache: Optional[ResponseCache] = ResponseCache() if cache_responses else None
+        self.extract_cache: Optional[ExtractCache] = ExtractCache() if cache_responses else None
         self.last_activity: Optional[float] = None
 
         self._lock = asyncio.Lock()
@@ -35,7 +108,11 @@ class BrowserSession:
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self.pool: Optional[BrowserPool] = None
+        self._shared_key: Optional[_SharedKey] = None
         self._cleanup_registered = False
+        self._gc_task: Optional[asyncio.Task[None]] = None
+        self._prewarm_task: Optional[asyncio.Task[None]] = None
 
     @property
     def logger(self) -> logging.Logger:
@@ -57,101 +134,150 @@ class BrowserSession:
                 atexit.register(self._emergency_cleanup)
                 self._cleanup_registered = True
 
-            self.playwright = await async_playwright().start()
-
-            self.browser = await self.playwright.firefox.launch(
-                headless=self.headless,
-                firefox_user_prefs={
-                    "dom.webdriver.enabled": False,
-                    "useAutomationExtension": False,
-                    "general.platform.override": "Win32",
-                    "general.useragent.override": (
-                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) "
-                        "Gecko/20100101 Firefox/120.0"
-                    ),
-                },
-            )
-
-            self.context = await self.browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent=(
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) "
-                    "Gecko/20100101 Firefox/120.0"
-                ),
-                locale="en-US",
-                timezone_id="America/New_York",
-                permissions=["geolocation"],
-                geolocation={"latitude": 40.7128, "longitude": -74.0060},
-                extra_http_headers={
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Accept-Encoding": "gzip, deflate, br",
-                    "Accept": (
-                        "text/html,application/xhtml+xml,application/xml;q=0.9,"  # noqa: E501
-                        "image/webp,*/*;q=0.8"
-                    ),
-                    "DNT": "1",
-                    "Connection": "keep-alive",
-                    "Upgrade-Insecure-Requests": "1",
-                    "Sec-Fetch-Dest": "document",
-                    "Sec-Fetch-Mode": "navigate",
-                    "Sec-Fetch-Site": "none",
-                    "Cache-Control": "max-age=0",
-                },
-            )
-
-            await self.context.add_init_script(
-                """
-                Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [
-                        { name: 'Chrome PDF Plugin', filename: 'internal-pdf-viewer' },
-                        { name: 'Chrome PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai' },
-                        { name: 'Native Client', filename: 'internal-nacl-plugin' }
-                    ]
-                });
-                Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
-                Object.defineProperty(navigator, 'platform', { get: () => 'Win32' });
-                window.chrome = { runtime: {} };
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications'
-                        ? Promise.resolve({ state: Notification.permission })
-                        : originalQuery(parameters)
-                );
-                """
-            )
+            try:
+                await self._acquire_browser()
+                span["engine"] = self.engine
 
-            self.page = await self.context.new_page()
-            self.last_activity = asyncio.get_event_loop().time()
+                self.pool = BrowserPool(
+                    self.browser,
+                    max_size=self.pool_size,
+                    block_resources=self.block_resources,
+                    response_cache=self.response_cache,
+                )
+                self.context = await _make_context(self.browser, block_resources=self.block_assets)
+                self.page = await self.context.new_page()
+            except Exception:
+                # A half-started session would make later start() calls no-ops.
+                await self.close()
+                raise
+            self.last_activity = time.monotonic()
+            if self.session_timeout > 0:
+                self._gc_task = asyncio.create_task(self._idle_gc())
+            if self.prewarm_contexts > 0:
+                self._prewarm_task = asyncio.create_task(self._prewarm_pool())
+
+    async def _prewarm_pool(self) -> None:
+        """Fill the page pool in the background so first leases are warm."""
+        try:
+            assert self.pool is not None
+            await self.pool.prewarm(self.prewarm_contexts)
+        except Exception:
+            self.logger.warning("browser.prewarm.failed", exc_info=True)
+
+    async def _idle_gc(self) -> None:
+        """Close the browser once it has been idle for ``session_timeout``."""
+        while True:
+            idle = time.monotonic() - (self.last_activity or 0.0)
+            if idle < self.session_timeout:
+                await asyncio.sleep(self.session_timeout - idle)
+                continue
+            async with self._lock:
+                # Re-check under the lock: a call may have just refreshed it.
+                if time.monotonic() - (self.last_activity or 0.0) >= self.session_timeout:
+                    self.logger.info(
+                        "browser.idle_close",
+                        extra={"operation": "idle_close", "timeout": self.session_timeout},
+                    )
+                    await self.close()
+                    return
+
+    async def _acquire_browser(self) -> None:
+        """Take a reference on the shared browser, launching it if needed."""
+        key = (self.engine, self.headless, self.cdp_endpoint)
+        async with _shared_lock:
+            shared = _shared_browsers.get(key)
+            if shared is None or not shared.browser.is_connected():
+                playwright = await async_playwright().start()
+                try:
+                    browser = await self._launch_browser(playwright)
+                except Exception:
+                    await playwright.stop()
+                    raise
+                shared = _shared_browsers[key] = _SharedBrowser(playwright, browser)
+            shared.refs += 1
+        self._shared_key = key
+        self.playwright = shared.playwright
+        self.browser = shared.browser
+
+    async def _release_browser(self) -> None:
+        """Drop this session's reference, stopping the browser on the last one."""
+        key, self._shared_key = self._shared_key, None
+        async with _shared_lock:
+            shared = _shared_browsers.get(key) if key else None
+            if shared is not None and shared.browser is self.browser:
+                shared.refs -= 1
+                if shared.refs > 0:
+                    return
+                del _shared_browsers[key]
+        # Last reference, or a browser that has already been replaced.
+        graceful = True
+        if self.browser:
+            try:
+                await self.browser.close()
+            except Exception:
+                graceful = False
+        if self.playwright:
+            try:
+                await self.playwright.stop()
+            except Exception:
+                graceful = False
+        # The process-table sweep is a fallback for a teardown that failed, and
+        # only safe once no other session is still using a browser process.
+        if not graceful and not _shared_browsers:
+            await asyncio.to_thread(cleanup_manager.force_cleanup_all)
+
+    async def _launch_browser(self, playwright: Any) -> Browser:
+        """Launch (or attach to) the browser selected by ``engine``."""
+        if self.cdp_endpoint:
+            return await playwright.chromium.connect_over_cdp(self.cdp_endpoint)
+
+        if self.engine == "chromium":
+            args = list(_CHROMIUM_ARGS)
+            debug_port = os.environ.get("BROWSER_CDP_PORT")
+            if debug_port:
+                args.append(f"--remote-debugging-port={debug_port}")
+            return await playwright.chromium.launch(headless=self.headless, args=args)
+
+        return await playwright.firefox.launch(headless=self.headless, firefox_user_prefs=_FIREFOX_PREFS)
+
+    @classmethod
+    async def connect_cdp(cls, endpoint: str, **kwargs: Any) -> "BrowserSession":
+        """Create a session attached to an already running Chromium."""
+        session = cls(cdp_endpoint=endpoint, **kwargs)
+        await session.start()
+        return session
 
     async def close(self) -> None:
         """Close the browser and tear down associated resources."""
+        gc_task, self._gc_task = self._gc_task, None
+        if gc_task and gc_task is not asyncio.current_task():
+            gc_task.cancel()
+        prewarm_task, self._prewarm_task = self._prewarm_task, None
+        if prewarm_task:
+            prewarm_task.cancel()
+
         async with self._operation_span("close") as span:
             with suppress_all_warnings():
                 try:
+                    contexts = ([self.context] if self.context else []) + (
+                        self.pool.contexts if self.pool else []
+                    )
+                    await save_storage_state(contexts)
                     if self.page:
                         try:
                             await self.page.close()
                         except Exception:
                             pass
+                    if self.pool:
+                        await self.pool.close()
                     if self.context:
                         try:
                             await self.context.close()
                         except Exception:
                             pass
-                    if self.browser:
-                        try:
-                            await self.browser.close()
-                        except Exception:
-                            pass
                     if self.playwright:
-                        try:
-                            await self.playwright.stop()
-                        except Exception:
-                            pass
-
-                    cleanup_manager.force_cleanup_all()
-                    gc.collect()
+                        await self._release_browser()
+                    _collect_after_close()
                 except Exception:
                     span["status"] = "partial"
 
@@ -159,24 +285,63 @@ class BrowserSession:
                 span["status"] = "noop"
 
             self.page = None
+            self.pool = None
             self.context = None
             self.browser = None
             self.playwright = None
 
     def _emergency_cleanup(self) -> None:
         """Emergency cleanup hook invoked at process exit."""
+        if not _shared_browsers:
+            return  # every browser was already shut down gracefully
         try:
             cleanup_manager.force_cleanup_all()
         except Exception:
             pass
 
+    def is_ready(self) -> bool:
+        """Return True when the interactive page is open."""
+        return bool(self.page) and not self.page.is_closed()
+
     async def ensure_browser_ready(self) -> None:
         """Start the browser if needed and refresh activity timestamp."""
+        page = self.page
+        if page and not page.is_closed():
+            self.last_activity = time.monotonic()
+            return
+
         async with self._lock:
             if not self.page or self.page.is_closed():
-                await self.start()
-            loop = asyncio.get_event_loop()
-            self.last_activity = loop.time()
+                if self.browser and self.browser.is_connected():
+                    # Only the tab died; keep the running browser process.
+                    await self._reset_context()
+                else:
+                    if self.playwright:
+                        await self.close()
+                    await self.start()
+            self.last_activity = time.monotonic()
+
+    async def _reset_context(self) -> None:
+        """Replace the interactive context and page, keeping the browser."""
+        async with self._operation_span("reset_context"):
+            if self.context:
+                try:
+                    await self.context.close()
+                except Exception:
+                    pass
+            self.context = await _make_context(self.browser, block_resources=self.block_assets)
+            self.page = await self.context.new_page()
+
+    @asynccontextmanager
+    async def lease_page(self) -> AsyncIterator[Page]:
+        """Lease a page from a pooled context.
 
+        Unlike ``self.page`` this does not share navigation state, so several
+        leases can drive independent pages concurrently.
+        """
+        await self.ensure_browser_ready()
+        assert self.pool is not None
+        async with self.pool.acquire() as page:
+            yield page
 
 __all__ = ["BrowserSession"]
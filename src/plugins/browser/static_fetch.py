@@ -0,0 +1,152 @@
+"""Plain-HTTP extraction for pages that do not need a browser to render."""
+
+from __future__ import annotations
+
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+import httpx
+
+from .capabilities.navigation import _CAPTCHA_RE
+from .pool import _EXTRA_HEADERS, _USER_AGENTS
+
+# Subtrees the browser-side extraction also treats as boilerplate.
+_SKIPPED_TAGS = frozenset({"nav", "header", "footer", "aside", "script", "style", "noscript", "template"})
+_HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+_VOID_TAGS = frozenset({"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"})
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the pooled HTTP client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            # httpx negotiates Accept-Encoding itself (br needs an extra package)
+            headers={
+                **{k: v for k, v in _EXTRA_HEADERS.items() if k != "Accept-Encoding"},
+                "User-Agent": _USER_AGENTS["firefox"],
+            },
+            follow_redirects=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+        )
+    return _client
+
+
+async def aclose() -> None:
+    """Close the pooled HTTP client."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+class _ContentParser(HTMLParser):
+    """Collect title, paragraphs, headings and links in one streaming pass."""
+
+    def __init__(self, base_url: str) -> None:
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.title = ""
+        self.paragraphs: List[str] = []
+        self.headings: List[Dict[str, str]] = []
+        self.links: List[Dict[str, str]] = []
+        self._skip_depth = 0
+        self._in_title = False
+        # (tag, href) for every open <a>, <p> or heading collecting text
+        self._open: List[Tuple[str, Optional[str]]] = []
+        self._buffers: List[List[str]] = []
+
+    def handle_starttag(self, tag: str, attrs: List[tuple]) -> None:
+        if tag in _VOID_TAGS:
+            return
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+            return
+        if tag == "title":
+            self._in_title = True
+        elif self._skip_depth:
+            return
+        elif tag == "a":
+            href = dict(attrs).get("href") or ""
+            self._open.append(("a", href))
+            self._buffers.append([])
+        elif tag == "p" or tag in _HEADING_TAGS:
+            # An unclosed <p> ends where the next block starts.
+            if self._open and self._open[-1][0] == "p":
+                self._close("p")
+            self._open.append((tag, None))
+            self._buffers.append([])
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == "title":
+            self._in_title = False
+        elif any(open_tag == tag for open_tag, _ in self._open):
+            self._close(tag)
+
+    def _close(self, tag: str) -> None:
+        """Finish ``tag`` and anything left open inside it."""
+        while self._open:
+            open_tag, href = self._open.pop()
+            text = " ".join("".join(self._buffers.pop()).split())
+            if open_tag == "a":
+                if href and not href.startswith("javascript:") and text:
+                    self.links.append({"text": text, "href": urljoin(self.base_url, href)})
+            elif open_tag == "p":
+                self.paragraphs.append(text)
+            elif text:
+                self.headings.append({"tag": open_tag.upper(), "text": text})
+            if open_tag == tag:
+                return
+
+    def close(self) -> None:
+        super().close()
+        if self._open:
+            self._close(self._open[0][0])
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            self.title += data
+        elif not self._skip_depth:
+            for buffer in self._buffers:
+                buffer.append(data)
+
+
+async def fetch_static(url: str) -> Optional[Dict[str, Any]]:
+    """Fetch ``url`` over plain HTTP and extract it like ``extract_content_smart``.
+
+    Returns ``None`` when the page is not server-rendered HTML or the request
+    fails, so the caller can fall back to the browser.
+    """
+    try:
+        response = await _get_client().get(url)
+    except httpx.HTTPError:
+        return None
+
+    final_url = str(response.url)
+    content_type = response.headers.get("content-type", "")
+    if response.status_code != 200 or "html" not in content_type or _CAPTCHA_RE.search(final_url):
+        return None
+
+    parser = _ContentParser(final_url)
+    parser.feed(response.text)
+    parser.close()
+
+    text_value = "\n\n".join(parser.paragraphs)[:5000]
+    return {
+        "url": final_url,
+        "title": parser.title.strip(),
+        "text": text_value,
+        "headings": parser.headings[:20],
+        "links": parser.links[:50],
+        "status": "success" if text_value else "empty",
+        "method": "http",
+    }
+
+
+__all__ = ["fetch_static", "aclose"]
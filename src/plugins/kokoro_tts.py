@@ -9,6 +9,21 @@ class KokoroTTS:
     
     def __init__(self, base_url: str = "http://localhost:8880"):
         self.base_url = base_url.rstrip('/')
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=8, max_connections=16)
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
         
     async def generate_speech(self, text: str, voice: str = "af_sky") -> Optional[bytes]:
         """
@@ -22,23 +37,23 @@ class KokoroTTS:
             Audio bytes (MP3 format) or None if failed
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                # Kokoro OpenAI-compatible endpoint
-                response = await client.post(
-                    f"{self.base_url}/v1/audio/speech",
-                    json={
-                        "model": "kokoro",
-                        "input": text,
-                        "voice": voice,
-                        "response_format": "mp3"
-                    }
-                )
-                
-                if response.status_code == 200:
-                    return response.content
-                else:
-                    print(f"TTS error: {response.status_code}")
-                    return None
+            # Kokoro OpenAI-compatible endpoint
+            response = await self._get_client().post(
+                f"{self.base_url}/v1/audio/speech",
+                json={
+                    "model": "kokoro",
+                    "input": text,
+                    "voice": voice,
+                    "response_format": "mp3"
+                },
+                timeout=30.0
+            )
+            
+            if response.status_code == 200:
+                return response.content
+            else:
+                print(f"TTS error: {response.status_code}")
+                return None
                     
         except Exception as e:
             print(f"TTS error: {e}")
@@ -47,9 +62,8 @@ class KokoroTTS:
     async def health_check(self) -> bool:
         """Check if Kokoro TTS service is available."""
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.base_url}/health")
-                return response.status_code == 200
+            response = await self._get_client().get(f"{self.base_url}/health", timeout=5.0)
+            return response.status_code == 200
         except:
             return False
     
@@ -23,3 +23,46 @@ async def test_tool_dispatcher_executes_and_records_history():
 
     assert results and "\"value\": 1" in results[0]
     assert session.history[-1]["role"] == "assistant"
+
+
+class _CountingExecutor:
+    def __init__(self):
+        self.calls = 0
+
+    async def execute(self, server_name: str, tool_name: str, args):
+        self.calls += 1
+        return {"status": "success", "result": {"calls": self.calls}}
+
+
+@pytest.mark.asyncio
+async def test_tool_dispatcher_reuses_cached_read_only_results():
+    ToolDispatcher._result_cache.clear()
+    session = Session(id="demo", history=[])
+    session.loaded_tools = [
+        MCPTool(name="news", server="news", tool_name="get-news"),
+        MCPTool(name="click", server="browser", tool_name="click"),
+    ]
+    executor = _CountingExecutor()
+    dispatcher = ToolDispatcher(executor)
+
+    await dispatcher.execute_many(session, ["news"], {"news": {"topic": "ai"}})
+    await dispatcher.execute_many(session, ["news"], {"news": {"topic": "ai"}})
+    assert executor.calls == 1
+
+    await dispatcher.execute_many(session, ["click"], {"click": {"selector": "#go"}})
+    await dispatcher.execute_many(session, ["click"], {"click": {"selector": "#go"}})
+    assert executor.calls == 3
+    assert len(session.history) == 4
+
+
+@pytest.mark.asyncio
+async def test_tool_dispatcher_finds_tools_appended_in_place():
+    session = Session(id="demo", history=[])
+    session.loaded_tools = [MCPTool(name="echo", server="dummy", tool_name="echo_tool")]
+    session.loaded_tools.append(MCPTool(name="late", server="dummy", tool_name="late_tool"))
+
+    dispatcher = ToolDispatcher(_DummyExecutor())
+
+    results = await dispatcher.execute_many(session, ["late"], {"late": {"value": 2}})
+
+    assert results and "\"value\": 2" in results[0]
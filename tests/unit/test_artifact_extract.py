@@ -0,0 +1,37 @@
+"""Unit tests for web UI artifact extraction."""
+
+from src.agent._artifact_extract import extract_artifact
+
+
+def test_extracts_claude_style_html_artifact():
+    response = "Here you go\ntext/html\n<!DOCTYPE html><html><body>hi</body></html>\nEnjoy"
+
+    text, artifact = extract_artifact(response)
+
+    assert artifact == "<!DOCTYPE html><html><body>hi</body></html>"
+    assert text.startswith("Here you go\n")
+    assert "HTML artifact generated" in text
+    assert text.endswith("Enjoy")
+
+
+def test_extracts_html_code_fence():
+    response = "Game:\n```html\n<canvas></canvas>\n```\nHave fun"
+
+    text, artifact = extract_artifact(response)
+
+    assert artifact == "<canvas></canvas>"
+    assert "```" not in text
+    assert text.endswith("Have fun")
+
+
+def test_markdown_artifact_is_escaped():
+    response = "Notes\ntext/markdown\n# Title\nuse a < b"
+
+    text, artifact = extract_artifact(response)
+
+    assert "use a &lt; b" in artifact
+    assert "Markdown artifact generated" in text
+
+
+def test_plain_reply_is_untouched():
+    assert extract_artifact("just text") == ("just text", None)
@@ -197,6 +197,15 @@ class TestArtifactGenerator:
         assert '\n• Second feature' in formatted
         assert '\n• Third feature' in formatted
 
+    def test_needs_formatting_matches_formatter(self):
+        """Test the fast-path guard agrees with format_text_response."""
+        for text in ["OK", "42", "plain sentence here"]:
+            assert not ArtifactGenerator.needs_formatting(text)
+            assert ArtifactGenerator.format_text_response(text) == text
+
+        for text in ["a\n\nb", "- item", " padded", "x * y"]:
+            assert ArtifactGenerator.needs_formatting(text)
+
     def test_extract_artifact_claude_style(self):
         """Test extraction of Claude-style HTML artifacts."""
         response = """Here's the artifact:
@@ -0,0 +1,164 @@
+"""Unit tests for browser content capture helpers."""
+
+import logging
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from plugins.browser.capabilities.content import ContentExtractionMixin, ExtractCache
+from plugins.browser.capabilities.interaction import InteractionMixin
+from plugins.browser.capabilities.navigation import NavigationMixin
+from plugins.browser.runtime import operation_span
+
+
+class FakeCapture(ContentExtractionMixin):
+    def __init__(self, image=b"\xff\xd8jpeg"):
+        self.logger = logging.getLogger("test.browser.content")
+        self.page = MagicMock()
+        self.page.screenshot = AsyncMock(return_value=image)
+        self.ensure_browser_ready = AsyncMock()
+
+    def _operation_span(self, operation, **details):
+        return operation_span(self.logger, operation, **details)
+
+
+@pytest.mark.asyncio
+async def test_screenshot_encodings():
+    capture = FakeCapture()
+
+    raw = await capture.screenshot()
+    encoded = await capture.screenshot(encoding="base64")
+
+    assert raw["data"] == b"\xff\xd8jpeg"
+    assert encoded["data"] == "/9hqcGVn"
+
+
+@pytest.mark.asyncio
+async def test_screenshot_file_encoding_returns_only_a_path(monkeypatch):
+    capture = FakeCapture()
+
+    writes = []
+    monkeypatch.setattr(Path, "write_bytes", lambda self, data: writes.append(self))
+
+    result = await capture.screenshot(encoding="file")
+
+    saved = Path(result["path"])
+    try:
+        assert result["status"] == "saved"
+        assert "data" not in result
+        assert saved.suffix == ".jpeg"
+        assert saved.read_bytes() == b"\xff\xd8jpeg"
+        assert writes == []  # written once, by the temp-file helper only
+    finally:
+        saved.unlink()
+
+
+@pytest.mark.asyncio
+async def test_get_content_truncates_inside_the_page():
+    capture = FakeCapture()
+    capture.page.evaluate = AsyncMock(return_value="<html>")
+
+    content = await capture.get_content(max_chars=6)
+
+    assert content == "<html>"
+    assert capture.page.evaluate.await_args.args[1] == 6
+
+
+@pytest.mark.asyncio
+async def test_extract_content_smart_reuses_result_until_the_document_changes():
+    capture = FakeCapture()
+    capture.extract_cache = ExtractCache()
+    capture.page.url = "https://example.com/"
+    extracted = {"title": "t", "text": "body", "headings": [], "links": []}
+    time_origins = iter([1000.5, 1000.5, 2000.25])  # third call follows a reload
+    capture.page.evaluate = AsyncMock(
+        side_effect=lambda script, *args: extracted if "TreeWalker" in script else next(time_origins)
+    )
+
+    first = await capture.extract_content_smart()
+    second = await capture.extract_content_smart()
+    await capture.extract_content_smart()
+
+    assert first == second
+    assert first is not second
+    walks = [call for call in capture.page.evaluate.await_args_list if "TreeWalker" in call.args[0]]
+    assert len(walks) == 2
+    keys = [call.args[0] for call in capture.page.evaluate.await_args_list if "TreeWalker" not in call.args[0]]
+    assert keys == ["() => performance.timeOrigin"] * 3
+
+
+class FakeInteractiveCapture(FakeCapture, InteractionMixin):
+    def __init__(self):
+        super().__init__()
+        self.extract_cache = ExtractCache()
+        self.page.url = "https://example.com/form"
+        self.page.click = AsyncMock()
+
+
+@pytest.mark.asyncio
+async def test_click_invalidates_cached_extractions_for_the_same_document():
+    capture = FakeInteractiveCapture()
+    pages = iter([{"title": "t", "text": "Step 1"}, {"title": "t", "text": "Step 2"}])
+    capture.page.evaluate = AsyncMock(
+        side_effect=lambda script, *args: next(pages) if "TreeWalker" in script else 1000.5
+    )
+
+    first = await capture.extract_content_smart()
+    await capture.click("#next")
+    second = await capture.extract_content_smart()
+
+    assert first["text"] == "Step 1"
+    assert second["text"] == "Step 2"
+
+
+class FakeLoadingPage:
+    """Leased page whose document only has content after it has loaded."""
+
+    def __init__(self):
+        self.url = "about:blank"
+        self.loaded = False
+
+    async def goto(self, url, **_):
+        self.url = url
+        return MagicMock(status=200)
+
+    async def wait_for_load_state(self, state, **_):
+        self.loaded = True
+
+    async def title(self):
+        return "Loaded" if self.loaded else ""
+
+    async def evaluate(self, script, *args):
+        text = "Article body" if self.loaded else ""
+        return {"title": await self.title(), "text": text, "headings": [], "links": []}
+
+
+class FakeExtractor(ContentExtractionMixin, NavigationMixin):
+    def __init__(self):
+        self.logger = logging.getLogger("test.browser.content")
+        self.retry_count = 1
+        self.leased = FakeLoadingPage()
+        self.ensure_browser_ready = AsyncMock()
+
+    def _operation_span(self, operation, **details):
+        return operation_span(self.logger, operation, **details)
+
+    @asynccontextmanager
+    async def lease_page(self):
+        yield self.leased
+
+
+@pytest.mark.asyncio
+async def test_extract_url_waits_for_the_document_before_extracting():
+    extractor = FakeExtractor()
+
+    result = await extractor.extract_url("https://example.com/story")
+
+    assert result["status"] == "success"
+    assert result["text"] == "Article body"
+    assert result["url"] == "https://example.com/story"
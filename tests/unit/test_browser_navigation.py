@@ -0,0 +1,73 @@
+"""Unit tests for browser navigation retry behaviour."""
+
+import logging
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from plugins.browser.capabilities import navigation as navigation_module
+from plugins.browser.capabilities.navigation import NavigationMixin
+from plugins.browser.runtime import operation_span
+
+
+class FakeNavigator(NavigationMixin):
+    def __init__(self, goto_error):
+        self.retry_count = 3
+        self.logger = logging.getLogger("test.browser.navigation")
+        self.page = MagicMock()
+        self.page.goto = AsyncMock(side_effect=goto_error)
+        self.page.evaluate = AsyncMock()
+        self.ensure_browser_ready = AsyncMock()
+
+    def _operation_span(self, operation, **details):
+        return operation_span(self.logger, operation, **details)
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(navigation_module.asyncio, "sleep", AsyncMock())
+
+
+@pytest.mark.asyncio
+async def test_unresolvable_host_fails_without_retrying():
+    navigator = FakeNavigator(Exception("page.goto: net::ERR_NAME_NOT_RESOLVED at https://nope.invalid/"))
+
+    result = await navigator.navigate("nope.invalid")
+
+    assert result["status"] == "error"
+    assert navigator.page.goto.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_retry_on_the_same_page():
+    navigator = FakeNavigator(Exception("page.goto: Timeout 15000ms exceeded."))
+
+    result = await navigator.navigate("https://example.com")
+
+    assert result["status"] == "error"
+    assert navigator.page.goto.await_count == 3
+    assert navigator.page.evaluate.await_count == 2  # window.stop() between attempts
+
+
+@pytest.mark.asyncio
+async def test_navigate_without_selector_waits_for_the_parsed_document():
+    navigator = FakeNavigator(None)
+    navigator.page.goto = AsyncMock(return_value=MagicMock(status=200))
+    navigator.page.url = "https://example.com/"
+    navigator.page.title = AsyncMock(return_value="Example")
+    navigator.page.wait_for_load_state = AsyncMock()
+    navigator.page.wait_for_selector = AsyncMock()
+
+    await navigator.navigate("https://example.com")
+    navigator.page.wait_for_load_state.assert_awaited_once_with("domcontentloaded", timeout=None)
+
+    navigator.page.wait_for_load_state.reset_mock()
+    result = await navigator.navigate("https://example.com", wait_selector="a")
+
+    assert result["status"] == "success"
+    navigator.page.wait_for_selector.assert_awaited_once()
+    navigator.page.wait_for_load_state.assert_not_awaited()
@@ -0,0 +1,130 @@
+"""Unit tests for concurrent news probing in the browser plugin."""
+
+import asyncio
+import logging
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from plugins.browser.capabilities import news as news_module
+from plugins.browser.capabilities.news import NewsMixin
+from plugins.browser.runtime import operation_span
+from plugins.browser.static_fetch import _ContentParser
+
+LINKS = [{"text": "A sufficiently long headline", "href": "https://example.com/a"}]
+
+
+@pytest.fixture(autouse=True)
+def no_static_fetch(monkeypatch):
+    """Force the browser path unless a test opts into the HTTP fast path."""
+    static = AsyncMock(return_value=None)
+    monkeypatch.setattr(news_module, "fetch_static", static)
+    return static
+
+
+class FakeNewsSession(NewsMixin):
+    """Stand-in session whose sources answer after fixed delays."""
+
+    def __init__(self, outcomes):
+        self.outcomes = outcomes
+        self.cancelled = []
+        self.logger = logging.getLogger("test.browser.news")
+
+    def _operation_span(self, operation, **details):
+        return operation_span(self.logger, operation, **details)
+
+    def _outcome(self, url):
+        return next(value for key, value in self.outcomes.items() if key in url)
+
+    @asynccontextmanager
+    async def lease_page(self):
+        yield SimpleNamespace(url="about:blank")
+
+    async def navigate(self, url, wait_selector=None, page=None):
+        delay, status, _ = self._outcome(url)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(url)
+            raise
+        page.url = url
+        return {"status": status}
+
+    async def extract_content_smart(self, page=None):
+        _, _, links = self._outcome(page.url)
+        return {"status": "success" if links else "empty", "title": "t", "text": "body", "links": links or []}
+
+
+@pytest.mark.asyncio
+async def test_fastest_successful_source_wins_and_rest_are_cancelled():
+    session = FakeNewsSession(
+        {
+            "techcrunch": (0.5, "success", LINKS),
+            "arstechnica": (0.0, "captcha_detected", None),
+            "theverge": (0.01, "success", LINKS),
+        }
+    )
+
+    result = await session.get_news_smart(topic="ai", max_articles=5)
+
+    assert result["successful"] == 1
+    assert result["results"][0]["source"].startswith("https://www.theverge.com")
+    assert result["results"][0]["top_articles"][0]["url"] == "https://example.com/a"
+    assert any("techcrunch" in url for url in session.cancelled)
+
+
+@pytest.mark.asyncio
+async def test_all_sources_failing_reports_every_error():
+    session = FakeNewsSession(
+        {
+            "techcrunch": (0.0, "error", None),
+            "arstechnica": (0.0, "captcha_detected", None),
+            "theverge": (0.0, "success", None),
+        }
+    )
+
+    result = await session.get_news_smart(topic="ai")
+
+    assert result["successful"] == 0
+    assert sorted(error.rsplit(": ", 1)[1] for error in result["errors"]) == [
+        "CAPTCHA detected",
+        "Navigation failed",
+        "No content extracted",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_server_rendered_source_skips_the_browser(no_static_fetch):
+    headlines = [{"text": f"Server rendered headline {i}", "href": f"https://example.com/{i}"} for i in range(5)]
+    no_static_fetch.return_value = {"status": "success", "title": "t", "text": "body", "links": headlines}
+    session = FakeNewsSession({"": (0.0, "error", None)})
+    session.navigate = AsyncMock()
+
+    result = await session.get_news_smart(topic="ai", max_articles=5)
+
+    assert result["successful"] == 1
+    assert len(result["results"][0]["top_articles"]) == 5
+    session.navigate.assert_not_awaited()
+
+
+def test_content_parser_skips_boilerplate_and_resolves_links():
+    parser = _ContentParser("https://example.com/news/")
+    parser.feed(
+        "<title>Front &amp; Centre</title>"
+        "<nav><a href='/home'>Navigation link text</a></nav>"
+        "<h2>Top <b>story</b></h2>"
+        "<p>first<p>second <a href='story/1'>A story headline here</a> "
+        "<a href='javascript:void(0)'>script link</a>"
+    )
+    parser.close()
+
+    assert parser.title == "Front & Centre"
+    assert parser.headings == [{"tag": "H2", "text": "Top story"}]
+    assert parser.paragraphs == ["first", "second A story headline here script link"]
+    assert parser.links == [{"text": "A story headline here", "href": "https://example.com/news/story/1"}]
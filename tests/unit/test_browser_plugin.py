@@ -83,6 +83,24 @@ class TestBrowserPlugin:
             assert result["status"] == "success"
             assert result["title"] == "Test Page"
 
+    @pytest.mark.asyncio
+    async def test_browser_extract_content_with_url_uses_leased_page(self):
+        """Test that extracting a URL bypasses the interactive page."""
+        mock_browser = MagicMock()
+        mock_browser.extract_url = AsyncMock(return_value={"status": "success", "title": "Leased"})
+        mock_browser.extract_content_smart = AsyncMock()
+
+        async def mock_get_browser_func(headless=True):
+            return mock_browser
+
+        with patch('plugins.browser.get_browser', side_effect=mock_get_browser_func):
+            from plugins.browser import execute
+            result = await execute("browser", "browser_extract_content", {"url": "https://example.com"})
+
+            assert result["title"] == "Leased"
+            mock_browser.extract_url.assert_awaited_once_with("https://example.com", wait_selector=None)
+            mock_browser.extract_content_smart.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_unknown_tool(self):
         """Test handling of unknown tools."""
@@ -0,0 +1,162 @@
+"""Unit tests for the browser page pool."""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from plugins.browser.pool import BrowserPool, save_storage_state
+
+
+def _fake_browser():
+    browser = MagicMock()
+    browser.is_connected.return_value = True
+    return browser
+
+
+def _fake_context():
+    context = MagicMock()
+    context.pages = []
+    context.close = AsyncMock()
+
+    async def new_page():
+        page = MagicMock()
+        page.context = context
+        page.is_closed.return_value = False
+        page.goto = AsyncMock()
+        context.pages.append(page)
+        return page
+
+    context.new_page = AsyncMock(side_effect=new_page)
+    return context
+
+
+@pytest.mark.asyncio
+async def test_released_context_is_reused():
+    factory = AsyncMock(side_effect=lambda browser, **_: _fake_context())
+    pool = BrowserPool(_fake_browser(), max_size=2, context_factory=factory)
+
+    async with pool.acquire() as first:
+        pass
+    async with pool.acquire() as second:
+        pass
+
+    assert first is second
+    assert factory.await_count == 1
+    first.context.new_page.assert_awaited_once()
+    first.goto.assert_awaited_with("about:blank")
+
+
+@pytest.mark.asyncio
+async def test_context_is_recycled_after_lease_limit():
+    factory = AsyncMock(side_effect=lambda browser, **_: _fake_context())
+    pool = BrowserPool(_fake_browser(), max_size=1, context_factory=factory, recycle_after=2)
+
+    for _ in range(3):
+        async with pool.acquire() as page:
+            pass
+
+    assert factory.await_count == 2
+    assert pool.size == 1
+    assert pool.contexts == [page.context]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_leases_are_bounded_by_max_size():
+    factory = AsyncMock(side_effect=lambda browser, **_: _fake_context())
+    pool = BrowserPool(_fake_browser(), max_size=2, context_factory=factory)
+    active = 0
+    peak = 0
+
+    async def worker():
+        nonlocal active, peak
+        async with pool.acquire():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(worker() for _ in range(5)))
+
+    assert peak == 2
+    assert pool.size == 2
+
+
+@pytest.mark.asyncio
+async def test_prewarm_fills_idle_contexts_for_later_leases():
+    factory = AsyncMock(side_effect=lambda browser, **_: _fake_context())
+    pool = BrowserPool(_fake_browser(), max_size=2, context_factory=factory)
+
+    await pool.prewarm(5)
+    async with pool.acquire():
+        async with pool.acquire():
+            pass
+
+    assert pool.size == 2
+    assert factory.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_close_closes_every_context():
+    contexts = []
+
+    async def factory(browser, **_):
+        context = _fake_context()
+        contexts.append(context)
+        return context
+
+    pool = BrowserPool(_fake_browser(), max_size=2, context_factory=factory)
+    async with pool.acquire():
+        async with pool.acquire():
+            pass
+
+    await pool.close()
+
+    assert pool.size == 0
+    for context in contexts:
+        context.close.assert_awaited_once()
+    with pytest.raises(RuntimeError):
+        async with pool.acquire():
+            pass
+
+
+@pytest.mark.asyncio
+async def test_save_storage_state_merges_contexts(tmp_path, monkeypatch):
+    state_file = tmp_path / "state.json"
+    monkeypatch.setenv("BROWSER_STORAGE", str(state_file))
+    first, second = _fake_context(), _fake_context()
+    first.storage_state = AsyncMock(return_value={
+        "cookies": [{"name": "sid", "domain": "a.com", "path": "/", "value": "old"}],
+        "origins": [],
+    })
+    second.storage_state = AsyncMock(return_value={
+        "cookies": [
+            {"name": "sid", "domain": "a.com", "path": "/", "value": "new"},
+            {"name": "consent", "domain": "b.com", "path": "/", "value": "yes"},
+        ],
+        "origins": [{"origin": "https://b.com", "localStorage": []}],
+    })
+
+    await save_storage_state([first, second])
+
+    saved = json.loads(state_file.read_text())
+    assert sorted(c["value"] for c in saved["cookies"]) == ["new", "yes"]
+    assert saved["origins"] == [{"origin": "https://b.com", "localStorage": []}]
+    assert state_file.stat().st_mode & 0o777 == 0o600
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+
+@pytest.mark.asyncio
+async def test_save_storage_state_is_opt_in(monkeypatch):
+    monkeypatch.delenv("BROWSER_STORAGE", raising=False)
+    context = _fake_context()
+    context.storage_state = AsyncMock()
+
+    await save_storage_state([context])
+
+    context.storage_state.assert_not_awaited()
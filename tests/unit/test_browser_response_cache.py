@@ -0,0 +1,90 @@
+"""Unit tests for the browser plugin's route-level response cache."""
+
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from plugins.browser.response_cache import ResponseCache
+
+
+def _route(url, method="GET", status=200, headers=None, body=b"<html></html>"):
+    route = MagicMock()
+    route.request.url = url
+    route.request.method = method
+    response = MagicMock()
+    response.status = status
+    response.headers = headers if headers is not None else {"cache-control": "public, max-age=60"}
+    response.body = AsyncMock(return_value=body)
+    route.fetch = AsyncMock(return_value=response)
+    route.fulfill = AsyncMock()
+    route.continue_ = AsyncMock()
+    return route
+
+
+def test_freshness_honours_cache_control():
+    assert ResponseCache.freshness({"cache-control": "public, max-age=120"}) == 120
+    assert ResponseCache.freshness({"cache-control": "s-maxage=30"}) == 30
+    assert ResponseCache.freshness({"cache-control": "private, max-age=120"}) == 0
+    assert ResponseCache.freshness({"cache-control": "no-store"}) == 0
+    assert ResponseCache.freshness({}) == 0
+
+
+def test_put_evicts_least_recently_used_when_over_budget():
+    cache = ResponseCache(max_entries=2)
+    for url in ("a", "b"):
+        cache.put(url, 200, {}, b"x", ttl=60)
+    cache.get("a")  # "b" is now the least recently used entry
+    cache.put("c", 200, {}, b"x", ttl=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+@pytest.mark.asyncio
+async def test_serve_fetches_once_then_fulfills_from_memory():
+    cache = ResponseCache()
+    first = _route("https://example.com/", headers={"cache-control": "max-age=60", "content-encoding": "gzip"})
+    await cache.serve(first)
+    first.fetch.assert_awaited_once_with(max_redirects=0)
+
+    second = _route("https://example.com/")
+    await cache.serve(second)
+
+    second.fetch.assert_not_awaited()
+    kwargs = second.fulfill.await_args.kwargs
+    assert kwargs["body"] == b"<html></html>"
+    assert "content-encoding" not in kwargs["headers"]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_serve_passes_through_uncacheable_requests():
+    cache = ResponseCache()
+    await cache.serve(_route("https://example.com/form", method="POST"))
+    await cache.serve(_route("https://example.com/live", headers={"cache-control": "no-cache"}))
+
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_serve_hands_failed_fetches_back_to_the_browser():
+    cache = ResponseCache()
+    route = _route("https://unreachable.invalid/")
+    route.fetch.side_effect = Exception("net::ERR_NAME_NOT_RESOLVED")
+
+    await cache.serve(route)
+
+    route.continue_.assert_awaited_once()
+    route.fulfill.assert_not_awaited()
+    assert len(cache) == 0
+
+    closed = _route("https://example.com/")
+    closed.fetch.side_effect = Exception("Target page, context or browser has been closed")
+    closed.continue_.side_effect = Exception("Route is already handled!")
+
+    await cache.serve(closed)  # must not raise out of the route handler
@@ -0,0 +1,162 @@
+"""Unit tests for browser session lifecycle helpers."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from plugins.browser import session as session_module
+from plugins.browser.session import BrowserSession
+
+
+def _open_page():
+    page = MagicMock()
+    page.is_closed.return_value = False
+    return page
+
+
+@pytest.mark.asyncio
+async def test_ensure_browser_ready_skips_lock_when_page_is_open():
+    session = BrowserSession()
+    session.page = _open_page()
+    session._lock = MagicMock()  # any use of the lock would fail the await
+    session.start = AsyncMock()
+
+    await session.ensure_browser_ready()
+
+    session.start.assert_not_awaited()
+    assert session.last_activity is not None
+
+
+@pytest.mark.asyncio
+async def test_ensure_browser_ready_starts_missing_page_once():
+    session = BrowserSession()
+
+    async def fake_start():
+        session.page = _open_page()
+
+    session.start = AsyncMock(side_effect=fake_start)
+
+    await session.ensure_browser_ready()
+    await session.ensure_browser_ready()
+
+    session.start.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_warmup_is_opt_in_and_swallows_start_failures(monkeypatch):
+    import plugins.browser as browser_module
+
+    monkeypatch.delenv("BROWSER_WARMUP", raising=False)
+    assert browser_module.schedule_warmup() is None
+
+    failing = MagicMock()
+    failing.start = AsyncMock(side_effect=RuntimeError("no browser binary"))
+    monkeypatch.setattr(browser_module, "get_browser", AsyncMock(return_value=failing))
+    monkeypatch.setenv("BROWSER_WARMUP", "1")
+
+    task = browser_module.schedule_warmup()
+
+    assert await task is None
+    failing.start.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_idle_gc_closes_after_session_timeout_only_once_idle():
+    session = BrowserSession(session_timeout=0.05)
+    session.close = AsyncMock()
+    session.last_activity = time.monotonic()
+
+    gc_task = asyncio.create_task(session._idle_gc())
+    await asyncio.sleep(0.03)
+    session.last_activity = time.monotonic()  # activity postpones the close
+    await asyncio.sleep(0.03)
+    session.close.assert_not_awaited()
+
+    await asyncio.wait_for(gc_task, timeout=1)
+    session.close.assert_awaited_once()
+
+
+def _patch_launch(monkeypatch):
+    """Replace the Playwright driver and browser launch with mocks."""
+    driver = MagicMock()
+    driver.stop = AsyncMock()
+    monkeypatch.setattr(session_module, "async_playwright", lambda: MagicMock(start=AsyncMock(return_value=driver)))
+    browser = MagicMock()
+    browser.is_connected.return_value = True
+    browser.close = AsyncMock()
+    launch = AsyncMock(return_value=browser)
+    monkeypatch.setattr(BrowserSession, "_launch_browser", launch)
+    context = MagicMock()
+    context.new_page = AsyncMock(side_effect=lambda: _open_page())
+    context.close = AsyncMock()
+    monkeypatch.setattr(session_module, "_make_context", AsyncMock(return_value=context))
+    monkeypatch.setattr(session_module, "save_storage_state", AsyncMock())
+    # A leaked entry would make the atexit hook sweep real browser processes.
+    monkeypatch.setattr(session_module, "_shared_browsers", {})
+    force_cleanup = MagicMock()
+    monkeypatch.setattr(session_module.cleanup_manager, "force_cleanup_all", force_cleanup)
+    return driver, browser, launch, force_cleanup
+
+
+@pytest.mark.asyncio
+async def test_sessions_share_one_browser_until_the_last_closes(monkeypatch):
+    driver, browser, launch, force_cleanup = _patch_launch(monkeypatch)
+
+    first = BrowserSession(session_timeout=0, prewarm_contexts=0, engine="firefox")
+    second = BrowserSession(session_timeout=0, prewarm_contexts=0, engine="firefox")
+    await first.start()
+    await second.start()
+
+    launch.assert_awaited_once()
+    assert first.browser is second.browser
+
+    await first.close()
+    browser.close.assert_not_awaited()
+
+    await second.close()
+    browser.close.assert_awaited_once()
+    driver.stop.assert_awaited_once()
+    force_cleanup.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_process_sweep_only_follows_a_failed_teardown(monkeypatch):
+    _, browser, _, force_cleanup = _patch_launch(monkeypatch)
+    browser.close.side_effect = RuntimeError("driver gone")
+
+    session = BrowserSession(session_timeout=0, prewarm_contexts=0, engine="firefox")
+    await session.start()
+    await session.close()
+
+    force_cleanup.assert_called_once()
+
+def test_block_assets_is_opt_in(monkeypatch):
+    monkeypatch.delenv("BROWSER_BLOCK_ASSETS", raising=False)
+    assert BrowserSession().block_assets is False
+    assert BrowserSession(block_assets=True).block_assets is True
+
+    monkeypatch.setenv("BROWSER_BLOCK_ASSETS", "1")
+    assert BrowserSession().block_assets is True
+
+
+@pytest.mark.asyncio
+async def test_closed_page_is_replaced_without_relaunching(monkeypatch):
+    _, browser, launch, _ = _patch_launch(monkeypatch)
+    session = BrowserSession(session_timeout=0, prewarm_contexts=0, engine="firefox")
+    await session.start()
+    session.start = AsyncMock()
+    crashed = session.page
+    crashed.is_closed.return_value = True
+
+    await session.ensure_browser_ready()
+
+    session.start.assert_not_awaited()
+    launch.assert_awaited_once()
+    assert session.browser is browser
+    assert session.page is not crashed
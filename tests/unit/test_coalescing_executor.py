@@ -0,0 +1,60 @@
+"""Unit tests for CoalescingExecutor."""
+
+import asyncio
+
+import pytest
+
+from src.agent.services.coalescing import CoalescingExecutor
+
+
+class _CountingExecutor:
+    def __init__(self, fail: bool = False) -> None:
+        self.calls = 0
+        self.fail = fail
+
+    async def execute(self, server_name, tool_name, args):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("upstream down")
+        return {"status": "success", "result": {"args": args}}
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_calls_share_one_execution():
+    inner = _CountingExecutor()
+    executor = CoalescingExecutor(inner)
+
+    results = await asyncio.gather(
+        *(executor.execute("news", "get-news", {"topic": "ai"}) for _ in range(5))
+    )
+
+    assert inner.calls == 1
+    assert all(result == results[0] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_distinct_args_and_sequential_calls_are_not_merged():
+    inner = _CountingExecutor()
+    executor = CoalescingExecutor(inner)
+
+    await asyncio.gather(
+        executor.execute("news", "get-news", {"topic": "ai"}),
+        executor.execute("news", "get-news", {"topic": "space"}),
+    )
+    await executor.execute("news", "get-news", {"topic": "ai"})
+
+    assert inner.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_failures_propagate_to_every_waiter():
+    executor = CoalescingExecutor(_CountingExecutor(fail=True))
+
+    results = await asyncio.gather(
+        executor.execute("news", "get-news", {}),
+        executor.execute("news", "get-news", {}),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
@@ -0,0 +1,44 @@
+"""Unit tests for streaming the first ReAct reply as draft deltas."""
+
+import pytest
+
+from src.agent.react_loop import _stream_draft
+
+
+def _reply(*tokens):
+    async def stream(prompt):
+        for token in tokens:
+            yield token
+
+    return stream
+
+
+async def _run(stream):
+    deltas = []
+
+    async def on_delta(text):
+        deltas.append(text)
+
+    full = await _stream_draft(stream, "prompt", on_delta)
+    return full, deltas
+
+
+@pytest.mark.asyncio
+async def test_stream_draft_forwards_plain_answer():
+    tokens = ["The answer ", "is forty-two, ", "as computed ", "earlier ", "in the thread."]
+
+    full, deltas = await _run(_reply(*tokens))
+
+    assert full == "".join(tokens)
+    assert "".join(deltas) == full
+
+
+@pytest.mark.asyncio
+async def test_stream_draft_withholds_tool_calls():
+    tokens = ["Let me check the latest data for you first. ", "TOOL", "_CALL: news.get-news", " {}"]
+
+    full, deltas = await _run(_reply(*tokens))
+
+    assert full == "".join(tokens)
+    assert "TOOL" not in "".join(deltas)
+    assert "".join(deltas).startswith("Let me check")
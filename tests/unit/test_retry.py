@@ -0,0 +1,39 @@
+"""Unit tests for the async retry helper."""
+
+import pytest
+
+from src.agent.utils.retry import retry_async
+
+
+@pytest.mark.asyncio
+async def test_retry_async_uses_capped_exponential_schedule():
+    delays = []
+    attempts = {"count": 0}
+
+    async def record_sleep(delay):
+        delays.append(delay)
+
+    async def flaky():
+        attempts["count"] += 1
+        if attempts["count"] < 4:
+            raise ValueError("transient")
+        return "ok"
+
+    result = await retry_async(
+        flaky, retries=3, base_delay=1.0, max_delay=3.0, jitter=0, sleep=record_sleep
+    )
+
+    assert result == "ok"
+    assert delays == [1.0, 2.0, 3.0]
+
+
+@pytest.mark.asyncio
+async def test_retry_async_reraises_after_exhausting_retries():
+    async def no_sleep(_delay):
+        return None
+
+    async def always_fails():
+        raise RuntimeError("down")
+
+    with pytest.raises(RuntimeError):
+        await retry_async(always_fails, retries=2, sleep=no_sleep)
@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from src.agent.services.http import tooling
+from src.agent.services.http.models import Message
+
+
+class _StreamingAgent:
+    def __init__(self, tokens, fail=False):
+        self._tokens = tokens
+        self._fail = fail
+
+    async def stream_response(self, prompt: str, context: str = ""):
+        for token in self._tokens:
+            yield token
+        if self._fail:
+            raise RuntimeError("upstream dropped")
+
+
+async def _collect(agent, prompt):
+    frames = []
+    async for frame in tooling.stream_response(
+        [Message(role="user", content=prompt)], agent, None, "mcp-agent", "req-1"
+    ):
+        frames.append(frame)
+    return frames
+
+
+def _contents(frames):
+    return [
+        json.loads(frame[len("data: "):])["choices"][0]["delta"]["content"]
+        for frame in frames
+        if frame != "data: [DONE]\n\n"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_response_forwards_agent_tokens():
+    frames = await _collect(_StreamingAgent(["Hel", "lo"]), "say hello please")
+
+    assert _contents(frames) == ["Hel", "lo", ""]
+    assert frames[-1] == "data: [DONE]\n\n"
+
+
+@pytest.mark.asyncio
+async def test_stream_response_terminates_stream_on_failure():
+    frames = await _collect(_StreamingAgent(["partial"], fail=True), "a failing prompt")
+
+    assert _contents(frames) == ["partial", ""]
+    assert frames[-1] == "data: [DONE]\n\n"
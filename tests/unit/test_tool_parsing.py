@@ -0,0 +1,25 @@
+"""Unit tests for tool call parsing helpers."""
+
+from src.agent.services.tool_parsing import parse_args_from_input, parse_tool_calls
+
+
+def test_parse_tool_calls_extracts_name_and_args():
+    names, args = parse_tool_calls("USE TOOL: foo\nkey: value")
+
+    assert names == ["foo"]
+    assert args == {"foo": {"key": "value"}}
+
+
+def test_parse_tool_calls_handles_multiple_hyphenated_tools():
+    response = "USE TOOL: read-file\npath: /tmp/a.txt\nUSE TOOL: get-time\n"
+
+    names, args = parse_tool_calls(response)
+
+    assert names == ["read-file", "get-time"]
+    assert args["read-file"] == {"path": "/tmp/a.txt"}
+    assert args["get-time"] == {}
+
+
+def test_parse_args_from_input_reads_path_hint():
+    assert parse_args_from_input("please open path: ./notes.md now") == {"path": "./notes.md"}
+    assert parse_args_from_input("no hints here") == {}
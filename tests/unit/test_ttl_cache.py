@@ -0,0 +1,42 @@
+"""Unit tests for the in-process TTL cache."""
+
+from src.agent.utils import ttl_cache
+from src.agent.utils.ttl_cache import TTLCache
+
+
+def test_ttl_cache_returns_value_until_expiry(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    cache: TTLCache[str] = TTLCache(maxsize=4, ttl=10)
+
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+
+    now[0] += 11
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_per_entry_ttl_override(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    cache: TTLCache[int] = TTLCache(maxsize=4, ttl=100)
+
+    cache.set("short", 1, ttl=1)
+    cache.set("long", 2)
+    now[0] += 5
+
+    assert "short" not in cache
+    assert cache.get("long") == 2
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache: TTLCache[int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
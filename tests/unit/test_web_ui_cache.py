@@ -0,0 +1,71 @@
+"""Unit tests for the web UI reply cache key and tool-call tracking."""
+
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from agent import react_loop, web_ui
+from agent.models import Session
+from agent.utils import json_codec
+from agent.utils.ttl_cache import TTLCache
+from agent.web_ui import _ToolCallRecorder, _react_cache_key
+
+
+def test_cache_key_depends_on_the_last_turn_only():
+    paris = {"role": "assistant", "content": "Paris."}
+    fresh = Session(id="webui", history=[])
+    later = Session(id="webui", history=[paris])
+    longer = Session(id="webui", history=[{"role": "assistant", "content": "Hi!"}, paris])
+
+    key = _react_cache_key(later, "And its population?")
+
+    assert key == _react_cache_key(later, "  and ITS population? ")
+    assert key == _react_cache_key(longer, "And its population?")
+    assert key != _react_cache_key(fresh, "And its population?")
+
+
+def test_repeated_question_is_served_from_cache_and_replayed_into_history(monkeypatch):
+    session = Session(id="webui", history=[{"role": "assistant", "content": "Paris."}])
+    agent = MagicMock(session=session)
+    calls = []
+
+    async def fake_loop(user_message, agent, executor, **_):
+        calls.append(user_message)
+        agent.session.history.append({"role": "assistant", "content": "About 2.1 million."})
+        return "About 2.1 million.", None
+
+    monkeypatch.setattr(web_ui, "get_agent", lambda: agent)
+    monkeypatch.setattr(web_ui, "_react_cache", TTLCache(maxsize=8, ttl=60))
+    monkeypatch.setattr(react_loop, "execute_react_loop", fake_loop)
+
+    replies = []
+    with TestClient(web_ui.app).websocket_connect("/ws") as ws:
+        for _ in range(2):
+            # Return the conversation to the same point before asking again.
+            session.history.append({"role": "assistant", "content": "Paris."})
+            ws.send_text(json_codec.dumps({"type": "message", "content": "And its population?"}))
+            replies.append(json_codec.loads(ws.receive_text()))
+
+    assert calls == ["And its population?"]
+    assert replies[0]["content"] == replies[1]["content"]
+    assert session.history[-1] == {"role": "assistant", "content": "About 2.1 million."}
+    assert len(session.history) == 5
+
+
+@pytest.mark.asyncio
+async def test_tool_call_recorder_flags_any_tool_use():
+    executor = MagicMock()
+    executor.execute = AsyncMock(return_value={"status": "success"})
+    tools = _ToolCallRecorder(executor)
+
+    assert tools.called is False
+    result = await tools.execute("browser", "navigate", {"url": "https://example.com"})
+
+    assert result == {"status": "success"}
+    assert tools.called is True
+    executor.execute.assert_awaited_once_with("browser", "navigate", {"url": "https://example.com"})